@@ -1,7 +1,11 @@
 import os
-import json
+import shutil
+import hashlib
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from typing import List
 
+import orjson
 import streamlit as st
 from dotenv import load_dotenv
 
@@ -9,6 +13,7 @@ from pipelines import PaperReviewPipeline, PaperReviewConfig
 from pipelines.config import MinerUConfig, LLMConfig
 
 
+@st.cache_resource(show_spinner=False)
 def create_pipeline(
     mineru_key: str,
     dashscope_key: str,
@@ -29,13 +34,47 @@ def create_pipeline(
     return PaperReviewPipeline(cfg)
 
 
-def run_pipeline(pipeline: PaperReviewPipeline, inputs: List[str], conference: str):
-    if len(inputs) == 1:
-        return pipeline(inputs[0], conference=conference)
-    return pipeline(inputs, conference=conference)
+def save_upload(file) -> str:
+    save_path = os.path.join("./uploads", file.name)
+    # Streamlit may leave the buffer position at the end after a previous read
+    file.seek(0)
+    with open(save_path, "wb") as f:
+        shutil.copyfileobj(file, f, length=1024 * 1024)
+    return save_path
 
 
-load_dotenv()
+# Each entry holds a whole serialized result, so keep only recent ones
+@st.cache_data(show_spinner=False, max_entries=32, ttl=3600)
+def result_json(output_file: str, timestamp: str, _res: dict) -> str:
+    # Keyed on the parsed output file and run timestamp; the result dict itself
+    # is not hashed
+    return orjson.dumps(_res, default=str, option=orjson.OPT_INDENT_2).decode("utf-8")
+
+
+def stream_pipeline(pipeline: PaperReviewPipeline, input_path, conference: str):
+    placeholder = st.empty()
+    output = ""
+    stream = pipeline.stream(input_path, conference=conference)
+    while True:
+        try:
+            output += next(stream)
+        except StopIteration as stop:
+            return stop.value
+        placeholder.markdown(output)
+
+
+def run_pipeline(pipeline: PaperReviewPipeline, inputs: List, conference: str):
+    # Single inputs are streamed; this path always reviews several papers
+    return asyncio.run(pipeline.acall(inputs, conference=conference))
+
+
+@st.cache_resource(show_spinner=False)
+def load_env() -> bool:
+    load_dotenv()
+    return True
+
+
+load_env()
 
 st.set_page_config(page_title="Reviewer2 On-Demand", page_icon="📝", layout="wide")
 
@@ -55,6 +94,11 @@ with st.sidebar:
         "Conference", ["auto", "neurips", "icml", "iclr", "aaai"], index=0
     )
     output_format = st.selectbox("Output format", ["json", "markdown", "txt"], index=0)
+    save_uploads = st.checkbox(
+        "Keep a copy of uploads in ./uploads",
+        value=False,
+        help="Uploads are otherwise sent to MinerU straight from memory",
+    )
 
     st.divider()
     st.subheader("LLM Settings")
@@ -63,7 +107,7 @@ with st.sidebar:
         "Temperature", min_value=0.0, max_value=1.0, value=0.1, step=0.05
     )
     max_tokens = st.number_input(
-        "Max tokens", min_value=256, max_value=8000, value=4000, step=128
+        "Max tokens", min_value=8, max_value=8000, value=16, step=8
     )
 
 st.subheader("Inputs")
@@ -82,18 +126,39 @@ with tab2:
         "Upload PDF files", type=["pdf"], accept_multiple_files=True
     )
 
-inputs: List[str] = []
+# Uploads are passed to the pipeline as in-memory file objects
+inputs: List = []
 
 if uploaded_files:
-    os.makedirs("./uploads", exist_ok=True)
-    for file in uploaded_files:
-        save_path = os.path.join("./uploads", file.name)
-        with open(save_path, "wb") as f:
-            f.write(file.getbuffer())
-        inputs.append(save_path)
+    digests = [hashlib.sha256(file.getbuffer()).hexdigest() for file in uploaded_files]
+    # One entry per distinct upload, in upload order
+    unique_uploads = {}
+    for digest, file in zip(digests, uploaded_files):
+        unique_uploads.setdefault(digest, file)
+
+    if save_uploads:
+        os.makedirs("./uploads", exist_ok=True)
+        # Skip re-writing uploads already saved during an earlier rerun
+        saved_uploads = st.session_state.setdefault("saved_uploads", {})
+        to_save = [
+            (digest, file)
+            for digest, file in unique_uploads.items()
+            if not os.path.exists(saved_uploads.get(digest, ""))
+        ]
+        if to_save:
+            with ThreadPoolExecutor(max_workers=min(4, len(to_save))) as executor:
+                paths = executor.map(save_upload, [file for _, file in to_save])
+                for (digest, _), path in zip(to_save, paths):
+                    saved_uploads[digest] = path
+        inputs.extend(saved_uploads[digest] for digest in unique_uploads)
+    else:
+        inputs.extend(unique_uploads.values())
 
 if urls.strip():
-    inputs.extend([line.strip() for line in urls.splitlines() if line.strip()])
+    # Drop repeated URLs/paths while keeping the input order
+    inputs.extend(
+        dict.fromkeys(line.strip() for line in urls.splitlines() if line.strip())
+    )
 
 col_run, col_clear = st.columns([1, 1])
 
@@ -137,7 +202,10 @@ if run_clicked:
 
         with st.spinner("Running review..."):
             try:
-                result = run_pipeline(pipeline, inputs, conference)
+                if len(inputs) == 1:
+                    result = stream_pipeline(pipeline, inputs[0], conference)
+                else:
+                    result = run_pipeline(pipeline, inputs, conference)
             except Exception as e:
                 st.exception(e)
                 st.stop()
@@ -163,7 +231,8 @@ if run_clicked:
                 st.code((pc.get("content") or "")[:2000])
 
             with st.expander("Raw JSON"):
-                st.code(json.dumps(res, indent=2, ensure_ascii=False))
+                pc = res.get("parsed_content", {})
+                st.code(result_json(pc.get("output_file"), res.get("timestamp"), res))
 
         if isinstance(result, list):
             for idx, item in enumerate(result, start=1):
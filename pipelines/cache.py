@@ -0,0 +1,221 @@
+"""
+Caching utilities for the Paper Review Pipeline.
+"""
+
+import os
+import json
+import shutil
+import sqlite3
+import hashlib
+import logging
+import tempfile
+import threading
+from pathlib import Path
+from collections import OrderedDict
+from datetime import datetime
+from typing import Union, Optional, Any, Dict, BinaryIO
+
+
+logger = logging.getLogger(__name__)
+
+# Session for the HEAD requests that fingerprint URL inputs, created on first
+# use so importing the pipeline does not import requests
+_http_session = None
+_http_session_lock = threading.Lock()
+
+
+def _get_http_session():
+    """Return the shared keep-alive session used for URL fingerprinting."""
+    global _http_session
+
+    with _http_session_lock:
+        if _http_session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            from urllib3.util.retry import Retry
+
+            retry = Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+            adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16, max_retries=retry)
+            _http_session = requests.Session()
+            _http_session.mount("https://", adapter)
+            _http_session.mount("http://", adapter)
+        return _http_session
+
+
+class ReviewCache:
+    """
+    Persistent cache of LLM review responses.
+
+    Entries are keyed by a SHA-256 digest of the exact prompt together with the
+    generation parameters, so re-submitting the same paper with the same
+    settings skips the LLM call entirely. The store is a single SQLite file
+    under the pipeline ``cache_dir``, fronted by a small in-memory LRU so
+    repeated lookups within a process (e.g. Streamlit reruns) skip the database.
+    """
+
+    def __init__(self, cache_dir: Union[str, Path], memory_size: int = 256):
+        """
+        Initialize the review cache.
+
+        Args:
+            cache_dir: Directory in which the SQLite database is created
+            memory_size: Number of most recently used entries kept in memory
+        """
+        cache_dir = Path(cache_dir)
+        cache_dir.mkdir(parents=True, exist_ok=True)
+
+        self.db_path = cache_dir / "reviews.sqlite"
+        self.memory_size = memory_size
+        self._memory: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS reviews ("
+                "key TEXT PRIMARY KEY, response TEXT NOT NULL, created_at TEXT)"
+            )
+
+    @staticmethod
+    def make_key(prompt: str, **params: Any) -> str:
+        """Build a cache key from the prompt and generation parameters."""
+        digest = hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+        payload = digest + json.dumps(params, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached response for ``key``, or None on a miss."""
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                return self._memory[key]
+
+            row = self._conn.execute(
+                "SELECT response FROM reviews WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+
+            self._remember(key, row[0])
+            return row[0]
+
+    def set(self, key: str, response: str):
+        """Store a response under ``key``."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO reviews (key, response, created_at) "
+                "VALUES (?, ?, ?)",
+                (key, response, datetime.now().isoformat()),
+            )
+            self._remember(key, response)
+
+    def _remember(self, key: str, response: str):
+        """Add an entry to the in-memory LRU, evicting the oldest if full."""
+        if self.memory_size <= 0:
+            return
+
+        self._memory[key] = response
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_size:
+            self._memory.popitem(last=False)
+
+    def close(self):
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+class ParseCache:
+    """
+    On-disk cache of MinerU markdown output.
+
+    Local files and in-memory uploads are fingerprinted by a SHA-256 of their
+    bytes, URLs by the URL plus the ``ETag``/``Last-Modified`` headers when the
+    server provides them. The parsing options are folded into the key, so changing e.g. ``is_ocr``
+    invalidates earlier entries. Each entry is ``<key>.md`` with a ``<key>.json``
+    sidecar recording the source and parsing options.
+    """
+
+    def __init__(self, cache_dir: Union[str, Path]):
+        """
+        Initialize the parse cache.
+
+        Args:
+            cache_dir: Pipeline cache directory; entries go in its ``mineru`` subfolder
+        """
+        self.cache_dir = Path(cache_dir) / "mineru"
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def fingerprint(input_path: Union[str, BinaryIO]) -> str:
+        """Return a content fingerprint for a local file, URL or file object."""
+        if not isinstance(input_path, str):
+            digest = hashlib.sha256()
+            input_path.seek(0)
+            for chunk in iter(lambda: input_path.read(1024 * 1024), b""):
+                digest.update(chunk)
+            input_path.seek(0)
+            return digest.hexdigest()
+
+        if input_path.startswith(("http://", "https://")):
+            import requests
+
+            validator = ""
+            try:
+                response = _get_http_session().head(
+                    input_path, allow_redirects=True, timeout=10
+                )
+                validator = response.headers.get("ETag") or response.headers.get(
+                    "Last-Modified", ""
+                )
+            except requests.RequestException as e:
+                logger.debug(f"HEAD request failed for {input_path}: {e}")
+            return hashlib.sha256(f"{input_path}|{validator}".encode("utf-8")).hexdigest()
+
+        digest = hashlib.sha256()
+        with open(input_path, "rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    @staticmethod
+    def make_key(fingerprint: str, parsing_config: Dict[str, Any]) -> str:
+        """Combine a content fingerprint with the parsing options."""
+        payload = fingerprint + json.dumps(parsing_config, sort_keys=True)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the path of the cached markdown for ``key``, or None."""
+        markdown_file = self.cache_dir / f"{key}.md"
+        return str(markdown_file) if markdown_file.exists() else None
+
+    def put(
+        self,
+        key: str,
+        output_file: str,
+        input_path: str,
+        parsing_config: Dict[str, Any],
+    ):
+        """Copy a MinerU markdown output into the cache."""
+        self._atomic_copy(output_file, self.cache_dir / f"{key}.md")
+
+        meta = {
+            "input": input_path,
+            "output_file": output_file,
+            "parsing_config": parsing_config,
+            "created_at": datetime.now().isoformat(),
+        }
+        with open(self.cache_dir / f"{key}.json", "w", encoding="utf-8") as f:
+            json.dump(meta, f, indent=2, ensure_ascii=False)
+
+    def _atomic_copy(self, src: str, dst: Path):
+        """Copy ``src`` to ``dst`` so readers never see a partial file."""
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        os.close(fd)
+        try:
+            # copyfile uses os.sendfile where available, copying in the kernel
+            shutil.copyfile(src, tmp_path)
+            os.replace(tmp_path, dst)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
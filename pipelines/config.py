@@ -28,9 +28,16 @@ class LLMConfig:
     model_name: str = "qwen-plus"
     api_key: Optional[str] = None
     temperature: float = 0.1
-    max_tokens: int = 4000
+    max_tokens: int = 16  # the reply is only a {"score": N} object
+    context_window: int = 32768  # prompt + completion token budget of the model
+    batch_mode: str = "sync"  # sync, batch, auto
+    batch_threshold: int = 10  # minimum number of papers for batch_mode="auto"
+    batch_max_wait_time: int = 86400
+    structured_output: bool = True  # request JSON mode (response_format=json_object)
+    requests_per_minute: Optional[int] = None  # client-side limit for concurrent reviews
+    tokens_per_minute: Optional[int] = None  # prompt + completion tokens, client-side
     system_prompt: str = field(
-        default_factory=lambda: """You are an expert reviewer for top-tier machine learning conferences. Read the paper and output only a single integer score from 1 to 10 reflecting acceptance readiness for a top-tier conference. 1 = far below bar, 5 = borderline/uncertain, 10 = award-level. Output only the integer with no other text."""
+        default_factory=lambda: """You are an expert reviewer for top-tier machine learning conferences. Read the paper and output only a single integer score from 1 to 10 reflecting acceptance readiness for a top-tier conference. 1 = far below bar, 5 = borderline/uncertain, 10 = award-level. Respond only with a JSON object of the form {"score": <integer 1-10>} and no other text."""
     )
 
     review_criteria: List[str] = field(default_factory=lambda: [])
@@ -44,13 +51,17 @@ class PaperReviewConfig:
     cache_dir: Optional[str] = None
     device: str = "auto"
     torch_dtype: str = "auto"
+    max_concurrency: int = 4  # papers processed in parallel for batch inputs
+    enable_parse_cache: bool = True  # reuse MinerU output for identical inputs
+    enable_review_cache: bool = True  # reuse LLM responses for identical prompts
+    review_cache_max_temperature: float = 0.3  # don't cache more random sampling
 
     # Component configurations
     mineru: MinerUConfig = field(default_factory=MinerUConfig)
     llm: LLMConfig = field(default_factory=LLMConfig)
 
     # Output settings
-    save_parsed_content: bool = True
+    save_parsed_content: bool = False  # the markdown is already at parsed_content["output_file"]
     save_review_results: bool = True
     output_format: str = "json"  # json, markdown, txt
 
@@ -5,19 +5,85 @@ A high-level pipeline for end-to-end paper processing and review using MinerU pa
 """
 
 import os
-import json
+import re
+import time
+import copy
+import asyncio
 import logging
+import functools
 from pathlib import Path
-from typing import Union, List, Dict, Any, Optional
+from datetime import datetime
+from typing import (
+    TYPE_CHECKING,
+    BinaryIO,
+    Union,
+    List,
+    Dict,
+    Any,
+    Optional,
+    Generator,
+    Tuple,
+)
 from dataclasses import asdict
 
+import orjson
+
 from .config import PaperReviewConfig, MinerUConfig, LLMConfig
-from src.minerU.minerU import MinerUClient
-from src.llms.dashscope_client import DashScopeClient
+from .cache import ReviewCache, ParseCache
+from src.utils.async_utils import run_sync
+
+if TYPE_CHECKING:
+    from src.minerU.minerU import MinerUClient
+    from src.llms.dashscope_client import DashScopeClient
 
 
 logger = logging.getLogger(__name__)
 
+# Score pattern for the plain-text fallback in _parse_review_response
+_SCORE_SEARCH = re.compile(r"\b(10|[1-9])\b")
+
+# Flush streamed output after this many chunks or seconds, whichever comes first
+_STREAM_FLUSH_CHUNKS = 64
+_STREAM_FLUSH_INTERVAL = 0.05
+
+# orjson options for saved results and configs
+_JSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+
+# Rough characters-per-token ratio used when no tokenizer can be loaded
+_CHARS_PER_TOKEN = 4
+
+
+class ReviewParseError(Exception):
+    """Raised when an LLM response does not contain a usable score."""
+
+
+# A URL, a local file path, or an in-memory upload (binary file object with a
+# ``name``, e.g. a Streamlit UploadedFile)
+PaperInput = Union[str, BinaryIO]
+
+
+@functools.lru_cache(maxsize=None)
+def _load_encoding(model_name: str):
+    """Tokenizer for ``model_name``, loaded once per process, or None if unavailable."""
+    try:
+        import tiktoken
+
+        try:
+            return tiktoken.encoding_for_model(model_name)
+        except KeyError:
+            return tiktoken.get_encoding("cl100k_base")
+    except Exception as e:
+        logger.warning(f"Tokenizer unavailable, estimating token counts: {e}")
+        return None
+
+
+def _truncate_to_tokens(encoding, content: str, budget: int) -> Tuple[str, int]:
+    """Cut ``content`` to at most ``budget`` tokens; return it and its token count."""
+    tokens = encoding.encode(content, disallowed_special=())
+    if len(tokens) <= budget:
+        return content, len(tokens)
+    return encoding.decode(tokens[:budget]), budget
+
 
 class PaperReviewPipeline:
     """
@@ -27,6 +93,16 @@ class PaperReviewPipeline:
     comprehensive paper evaluation for top-tier ML conferences.
     """
 
+    _PROMPT_HEADER = (
+        "You are a reviewer for top-tier machine learning conferences. "
+        "Read the paper content below and score it with a single integer from 1 to 10 "
+        "that reflects the overall acceptance readiness for a top-tier conference. "
+        "1 = far below bar, 5 = borderline/uncertain, 10 = award-level. "
+        'Respond only with a JSON object of the form {"score": <integer>}.\n\n'
+        "Paper Content:\n"
+    )
+    _TRUNCATION_MARKER = "\n\n[Content truncated due to length]"
+
     def __init__(self, config: Optional[PaperReviewConfig] = None, **kwargs):
         """
         Initialize the Paper Review Pipeline.
@@ -36,17 +112,28 @@ class PaperReviewPipeline:
             **kwargs: Additional configuration parameters
         """
         self.config = config or PaperReviewConfig(**kwargs)
+        self._static_token_counts: Dict[str, int] = {}
+        self._rate_limiter = self._create_rate_limiter()
+
+        # Config snapshots embedded in every result; asdict deep-copies, so
+        # build them once instead of per paper
+        self._mineru_config_dict = asdict(self.config.mineru)
+        self._llm_config_dict = asdict(self.config.llm)
 
         # Initialize components
         self._init_mineru()
         self._init_llm()
+        self._init_cache()
 
         logger.info("Paper Review Pipeline initialized successfully")
 
     def _init_mineru(self):
         """Initialize MinerU client."""
+        # Imported lazily to keep module import (and Streamlit startup) cheap
+        from src.minerU.minerU import MinerUClient
+
         try:
-            self.mineru_client = MinerUClient(api_key=self.config.mineru.api_key)
+            self.mineru_client: "MinerUClient" = MinerUClient(api_key=self.config.mineru.api_key)
             logger.info("MinerU client initialized successfully")
         except Exception as e:
             logger.error(f"Failed to initialize MinerU client: {e}")
@@ -54,8 +141,10 @@ class PaperReviewPipeline:
 
     def _init_llm(self):
         """Initialize LLM client."""
+        from src.llms.dashscope_client import DashScopeClient
+
         try:
-            self.llm_client = DashScopeClient(
+            self.llm_client: "DashScopeClient" = DashScopeClient(
                 api_key=self.config.llm.api_key, model=self.config.llm.model_name
             )
             logger.info(
@@ -65,30 +154,127 @@ class PaperReviewPipeline:
             logger.error(f"Failed to initialize LLM client: {e}")
             raise
 
+    def _init_cache(self):
+        """Initialize the parse and review caches."""
+        self.parse_cache = None
+        if self.config.enable_parse_cache:
+            try:
+                self.parse_cache = ParseCache(self.config.cache_dir)
+                logger.info(f"Parse cache enabled at: {self.parse_cache.cache_dir}")
+            except Exception as e:
+                logger.warning(f"Failed to initialize parse cache: {e}")
+
+        self.review_cache = None
+        if self.config.enable_review_cache:
+            try:
+                self.review_cache = ReviewCache(self.config.cache_dir)
+                logger.info(f"Review cache enabled at: {self.review_cache.db_path}")
+            except Exception as e:
+                logger.warning(f"Failed to initialize review cache: {e}")
+
     def __call__(
-        self, inputs: Union[str, List[str]], conference: str = "auto", **kwargs
+        self,
+        inputs: Union[PaperInput, List[PaperInput]],
+        conference: str = "auto",
+        **kwargs,
     ) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
         """
         Process papers and generate reviews.
 
         Args:
-            inputs: Paper URL(s) or file path(s)
+            inputs: Paper URL(s), file path(s) or uploaded file object(s)
             conference: Target conference (icml, neurips, iclr, aaaai, auto)
             **kwargs: Additional parameters
 
         Returns:
             Review results for the papers
         """
-        if isinstance(inputs, str):
+        if self._is_single_input(inputs):
             return self._process_single_paper(inputs, conference, **kwargs)
         else:
             return self._process_multiple_papers(inputs, conference, **kwargs)
 
+    async def acall(
+        self,
+        inputs: Union[PaperInput, List[PaperInput]],
+        conference: str = "auto",
+        **kwargs,
+    ) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
+        """
+        Async variant of ``__call__`` for callers that run their own event loop.
+
+        Args:
+            inputs: Paper URL(s), file path(s) or uploaded file object(s)
+            conference: Target conference (icml, neurips, iclr, aaaai, auto)
+            **kwargs: Additional parameters
+
+        Returns:
+            Review results for the papers
+        """
+        if self._is_single_input(inputs):
+            return await self._aprocess_single_paper(inputs, conference, **kwargs)
+        else:
+            return await self._aprocess_multiple_papers(inputs, conference, **kwargs)
+
+    def stream(
+        self, input_path: PaperInput, conference: str = "auto", **kwargs
+    ) -> Generator[str, None, Dict[str, Any]]:
+        """
+        Process a single paper, streaming the LLM output as it is generated.
+
+        Text is yielded in small batches so that UIs are not redrawn for every
+        token. The full result dict is the generator's return value.
+
+        Args:
+            input_path: Paper URL, file path or uploaded file object
+            conference: Target conference (icml, neurips, iclr, aaaai, auto)
+            **kwargs: Additional parameters
+
+        Yields:
+            Batches of generated text
+        """
+        logger.info(f"Processing paper: {self._input_name(input_path)}")
+
+        parsed_content = self._parse_paper(input_path, **kwargs)
+
+        prompt = self._prepare_review_prompt(parsed_content, conference)
+        cache_key = self._review_cache_key(prompt, conference, **kwargs)
+        response = self._get_cached_review(cache_key)
+        if response is not None:
+            yield response
+            review = self._compile_review(response, conference, cached=True)
+            return self._compile_result(input_path, conference, parsed_content, review)
+
+        chunks: List[str] = []
+        buffer: List[str] = []
+        last_flush = time.monotonic()
+        for chunk in self.llm_client.stream_generate(
+            prompt=prompt, **self._generation_kwargs(**kwargs)
+        ):
+            chunks.append(chunk)
+            buffer.append(chunk)
+            now = time.monotonic()
+            if (
+                len(buffer) >= _STREAM_FLUSH_CHUNKS
+                or now - last_flush >= _STREAM_FLUSH_INTERVAL
+            ):
+                yield "".join(buffer)
+                buffer.clear()
+                last_flush = now
+        if buffer:
+            yield "".join(buffer)
+
+        response = "".join(chunks)
+        review = self._compile_review(response, conference)
+        self._set_cached_review(cache_key, response)
+
+        return self._compile_result(input_path, conference, parsed_content, review)
+
     def _process_single_paper(
-        self, input_path: str, conference: str = "auto", **kwargs
+        self, input_path: PaperInput, conference: str = "auto", **kwargs
     ) -> Dict[str, Any]:
         """Process a single paper."""
-        logger.info(f"Processing paper: {input_path}")
+        logger.info(f"Processing paper: {self._input_name(input_path)}")
 
         # Step 1: Parse paper with MinerU
         parsed_content = self._parse_paper(input_path, **kwargs)
@@ -97,8 +283,29 @@ class PaperReviewPipeline:
         review = self._generate_review(parsed_content, conference, **kwargs)
 
         # Step 3: Compile results
+        return self._compile_result(input_path, conference, parsed_content, review)
+
+    async def _aprocess_single_paper(
+        self, input_path: PaperInput, conference: str = "auto", **kwargs
+    ) -> Dict[str, Any]:
+        """Async variant of :meth:`_process_single_paper`."""
+        logger.info(f"Processing paper: {self._input_name(input_path)}")
+
+        parsed_content = await self._aparse_paper(input_path, **kwargs)
+        review = await self._agenerate_review(parsed_content, conference, **kwargs)
+
+        return self._compile_result(input_path, conference, parsed_content, review)
+
+    def _compile_result(
+        self,
+        input_path: PaperInput,
+        conference: str,
+        parsed_content: Dict[str, Any],
+        review: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """Assemble the result dict for a paper and save it if configured."""
         result = {
-            "input": input_path,
+            "input": self._input_name(input_path),
             "conference": conference,
             "parsed_content": parsed_content,
             "review": review,
@@ -107,64 +314,305 @@ class PaperReviewPipeline:
 
         # Save results if configured
         if self.config.save_review_results:
-            self._save_results(result, input_path)
+            self._save_results(result, self._input_name(input_path))
 
         return result
 
     def _process_multiple_papers(
-        self, input_paths: List[str], conference: str = "auto", **kwargs
+        self, input_paths: List[PaperInput], conference: str = "auto", **kwargs
     ) -> List[Dict[str, Any]]:
-        """Process multiple papers."""
+        """Process multiple papers concurrently."""
+        return run_sync(
+            self._aprocess_multiple_papers(input_paths, conference, **kwargs)
+        )
+
+    async def _aprocess_multiple_papers(
+        self, input_paths: List[PaperInput], conference: str = "auto", **kwargs
+    ) -> List[Dict[str, Any]]:
+        """Process multiple papers, at most ``config.max_concurrency`` at a time."""
         logger.info(f"Processing {len(input_paths)} papers")
 
-        results = []
+        # Process each distinct input once and fan the result out to duplicates
+        unique_inputs: Dict[Any, PaperInput] = {}
         for input_path in input_paths:
+            unique_inputs.setdefault(self._input_key(input_path), input_path)
+        unique_paths = list(unique_inputs.values())
+        if len(unique_paths) < len(input_paths):
+            logger.info(
+                f"Skipping {len(input_paths) - len(unique_paths)} duplicate inputs"
+            )
+
+        if self._use_batch_mode(len(unique_paths)):
+            results = await self._aprocess_batch(unique_paths, conference, **kwargs)
+        else:
+            results = await self._aprocess_concurrently(
+                unique_paths, conference, **kwargs
+            )
+
+        # Later duplicates get their own copy, so mutating one result does not
+        # change the others
+        results_by_key = dict(zip(unique_inputs, results))
+        seen = set()
+        ordered_results = []
+        for input_path in input_paths:
+            key = self._input_key(input_path)
+            result = results_by_key[key]
+            ordered_results.append(copy.deepcopy(result) if key in seen else result)
+            seen.add(key)
+        return ordered_results
+
+    async def _aprocess_concurrently(
+        self, input_paths: List[PaperInput], conference: str = "auto", **kwargs
+    ) -> List[Dict[str, Any]]:
+        """
+        Run the parse-and-review flow for each paper concurrently.
+
+        Parsing and reviewing are limited by separate semaphores, so later
+        papers are parsed while earlier ones are still being reviewed instead
+        of waiting for a whole parse-and-review slot to free up.
+        """
+        parse_semaphore = asyncio.Semaphore(self.config.max_concurrency)
+        review_semaphore = asyncio.Semaphore(self.config.max_concurrency)
+
+        async def process(input_path: PaperInput) -> Dict[str, Any]:
+            try:
+                logger.info(f"Processing paper: {self._input_name(input_path)}")
+                async with parse_semaphore:
+                    parsed_content = await self._aparse_paper(input_path, **kwargs)
+                async with review_semaphore:
+                    review = await self._agenerate_review(
+                        parsed_content, conference, **kwargs
+                    )
+                return self._compile_result(
+                    input_path, conference, parsed_content, review
+                )
+            except Exception as e:
+                logger.error(f"Failed to process {self._input_name(input_path)}: {e}")
+                return self._error_result(input_path, e)
+
+        return list(await asyncio.gather(*(process(p) for p in input_paths)))
+
+    def _use_batch_mode(self, num_papers: int) -> bool:
+        """Whether reviews should go through the provider batch endpoint."""
+        batch_mode = self.config.llm.batch_mode
+        if batch_mode == "auto":
+            return num_papers >= self.config.llm.batch_threshold
+        return batch_mode == "batch"
+
+    async def _aprocess_batch(
+        self, input_paths: List[PaperInput], conference: str = "auto", **kwargs
+    ) -> List[Dict[str, Any]]:
+        """Parse all papers concurrently, then review them in one LLM batch job."""
+        semaphore = asyncio.Semaphore(self.config.max_concurrency)
+
+        async def parse(input_path: PaperInput):
+            async with semaphore:
+                try:
+                    return await self._aparse_paper(input_path, **kwargs)
+                except Exception as e:
+                    logger.error(f"Failed to parse {self._input_name(input_path)}: {e}")
+                    return e
+
+        parsed = await asyncio.gather(*(parse(p) for p in input_paths))
+
+        results: List[Optional[Dict[str, Any]]] = [None] * len(input_paths)
+        pending = []  # (index, prompt, cache_key) of papers needing the LLM
+        for idx, (input_path, parsed_content) in enumerate(zip(input_paths, parsed)):
+            if isinstance(parsed_content, Exception):
+                results[idx] = self._error_result(input_path, parsed_content)
+                continue
+
+            prompt = self._prepare_review_prompt(parsed_content, conference)
+            cache_key = self._review_cache_key(prompt, conference, **kwargs)
+            response = self._get_cached_review(cache_key)
+            if response is not None:
+                review = self._compile_review(response, conference, cached=True)
+                results[idx] = self._compile_result(
+                    input_path, conference, parsed_content, review
+                )
+            else:
+                pending.append((idx, prompt, cache_key))
+
+        if pending:
+            logger.info(f"Submitting {len(pending)} reviews as one batch job")
             try:
-                result = self._process_single_paper(input_path, conference, **kwargs)
-                results.append(result)
+                responses = await asyncio.to_thread(
+                    self.llm_client.batch_generate,
+                    [prompt for _, prompt, _ in pending],
+                    max_wait_time=self.config.llm.batch_max_wait_time,
+                    **self._generation_kwargs(**kwargs),
+                )
             except Exception as e:
-                logger.error(f"Failed to process {input_path}: {e}")
-                results.append(
-                    {
-                        "input": input_path,
-                        "error": str(e),
-                        "timestamp": self._get_timestamp(),
-                    }
+                logger.error(f"Batch review failed: {e}")
+                responses = [{"success": False, "error": str(e)}] * len(pending)
+
+            for (idx, _, cache_key), response in zip(pending, responses):
+                input_path = input_paths[idx]
+                if not response["success"]:
+                    results[idx] = self._error_result(
+                        input_path, Exception(f"Generation failed: {response['error']}")
+                    )
+                    continue
+
+                try:
+                    review = self._compile_review(response["content"], conference)
+                except ReviewParseError as e:
+                    results[idx] = self._error_result(input_path, e)
+                    continue
+
+                self._set_cached_review(cache_key, response["content"])
+                results[idx] = self._compile_result(
+                    input_path, conference, parsed[idx], review
                 )
 
         return results
 
-    def _parse_paper(self, input_path: str, **kwargs) -> Dict[str, Any]:
-        """Parse paper using MinerU."""
-        logger.info(f"Parsing paper: {input_path}")
+    def _error_result(self, input_path: PaperInput, error: Exception) -> Dict[str, Any]:
+        """Result entry for a paper that could not be processed."""
+        return {
+            "input": self._input_name(input_path),
+            "error": str(error),
+            "timestamp": self._get_timestamp(),
+        }
+
+    @staticmethod
+    def _is_single_input(inputs: Any) -> bool:
+        """Whether ``inputs`` is one paper rather than a list of papers."""
+        return isinstance(inputs, str) or hasattr(inputs, "read")
+
+    @staticmethod
+    def _input_key(input_path: PaperInput) -> Any:
+        """Hashable identity of an input; upload objects are compared by identity."""
+        return input_path if isinstance(input_path, str) else id(input_path)
+
+    @staticmethod
+    def _input_name(input_path: PaperInput) -> str:
+        """Display name of an input: the URL/path itself or the upload's file name."""
+        if isinstance(input_path, str):
+            return input_path
+        return getattr(input_path, "name", None) or "uploaded_paper.pdf"
+
+    def _mineru_kwargs(self) -> Dict[str, Any]:
+        """Keyword arguments forwarded to the MinerU client."""
+        return {
+            "output_dir": self.config.mineru.output_dir,
+            "is_ocr": self.config.mineru.is_ocr,
+            "enable_formula": self.config.mineru.enable_formula,
+            "enable_table": self.config.mineru.enable_table,
+            "language": self.config.mineru.language,
+            "model_version": self.config.mineru.model_version,
+            "max_wait_time": self.config.mineru.max_wait_time,
+        }
 
-        # Determine if input is URL or file path
-        if input_path.startswith(("http://", "https://")):
+    def _parse_paper(self, input_path: PaperInput, **kwargs) -> Dict[str, Any]:
+        """Parse paper using MinerU."""
+        logger.info(f"Parsing paper: {self._input_name(input_path)}")
+
+        # Reuse an earlier parse of the same content and options
+        cache_key = self._parse_cache_key(input_path)
+        cached_file = self._get_cached_parse(cache_key)
+        if cached_file is not None:
+            return self._load_parsed_content(cached_file)
+
+        # Determine if input is an upload, URL or file path
+        if not isinstance(input_path, str):
+            output_file = self.mineru_client.parse_from_bytes(
+                input_path, self._input_name(input_path), **self._mineru_kwargs(), **kwargs
+            )
+        elif input_path.startswith(("http://", "https://")):
             output_file = self.mineru_client.parse_from_url(
-                input_path,
-                output_dir=self.config.mineru.output_dir,
-                is_ocr=self.config.mineru.is_ocr,
-                enable_formula=self.config.mineru.enable_formula,
-                enable_table=self.config.mineru.enable_table,
-                language=self.config.mineru.language,
-                model_version=self.config.mineru.model_version,
-                max_wait_time=self.config.mineru.max_wait_time,
-                **kwargs,
+                input_path, **self._mineru_kwargs(), **kwargs
             )
         else:
             output_file = self.mineru_client.parse_from_file(
-                input_path,
-                output_dir=self.config.mineru.output_dir,
-                is_ocr=self.config.mineru.is_ocr,
-                enable_formula=self.config.mineru.enable_formula,
-                enable_table=self.config.mineru.enable_table,
-                language=self.config.mineru.language,
-                model_version=self.config.mineru.model_version,
-                max_wait_time=self.config.mineru.max_wait_time,
-                **kwargs,
+                input_path, **self._mineru_kwargs(), **kwargs
+            )
+        self._set_cached_parse(cache_key, output_file, input_path)
+
+        return self._load_parsed_content(output_file)
+
+    async def _aparse_paper(self, input_path: PaperInput, **kwargs) -> Dict[str, Any]:
+        """Async variant of :meth:`_parse_paper`."""
+        logger.info(f"Parsing paper: {self._input_name(input_path)}")
+
+        cache_key = await asyncio.to_thread(self._parse_cache_key, input_path)
+        cached_file = self._get_cached_parse(cache_key)
+        if cached_file is not None:
+            return self._load_parsed_content(cached_file)
+
+        if not isinstance(input_path, str):
+            output_file = await self.mineru_client.aparse_from_bytes(
+                input_path, self._input_name(input_path), **self._mineru_kwargs(), **kwargs
+            )
+        elif input_path.startswith(("http://", "https://")):
+            output_file = await self.mineru_client.aparse_from_url(
+                input_path, **self._mineru_kwargs(), **kwargs
+            )
+        else:
+            output_file = await self.mineru_client.aparse_from_file(
+                input_path, **self._mineru_kwargs(), **kwargs
             )
+        self._set_cached_parse(cache_key, output_file, input_path)
+
+        return self._load_parsed_content(output_file)
+
+    def _parse_cache_key(self, input_path: PaperInput) -> Optional[str]:
+        """Build the parse cache key, or None if caching is disabled."""
+        if self.parse_cache is None:
+            return None
+
+        try:
+            fingerprint = ParseCache.fingerprint(input_path)
+        except Exception as e:
+            logger.warning(f"Failed to fingerprint {self._input_name(input_path)}: {e}")
+            return None
+
+        return ParseCache.make_key(fingerprint, self._parsing_options())
+
+    def _parsing_options(self) -> Dict[str, Any]:
+        """MinerU options that affect the parsed output."""
+        return {
+            "is_ocr": self.config.mineru.is_ocr,
+            "enable_formula": self.config.mineru.enable_formula,
+            "enable_table": self.config.mineru.enable_table,
+            "language": self.config.mineru.language,
+            "model_version": self.config.mineru.model_version,
+        }
+
+    def _get_cached_parse(self, cache_key: Optional[str]) -> Optional[str]:
+        """Look up a cached MinerU output file."""
+        if cache_key is None:
+            return None
+
+        try:
+            cached_file = self.parse_cache.get(cache_key)
+        except Exception as e:
+            logger.warning(f"Failed to read parse cache: {e}")
+            return None
 
-        # Read parsed content
+        if cached_file is not None:
+            logger.info(f"Using cached parse result: {cached_file}")
+        return cached_file
+
+    def _set_cached_parse(
+        self, cache_key: Optional[str], output_file: str, input_path: PaperInput
+    ):
+        """Store a MinerU output file in the parse cache."""
+        if cache_key is None:
+            return
+
+        try:
+            self.parse_cache.put(
+                cache_key,
+                output_file,
+                self._input_name(input_path),
+                self._parsing_options(),
+            )
+        except Exception as e:
+            logger.warning(f"Failed to write parse cache: {e}")
+
+    def _load_parsed_content(self, output_file: str) -> Dict[str, Any]:
+        """Read the markdown produced by MinerU."""
         with open(output_file, "r", encoding="utf-8") as f:
             content = f.read()
 
@@ -172,7 +620,7 @@ class PaperReviewPipeline:
             "output_file": output_file,
             "content": content,
             "file_size": len(content),
-            "parsing_config": asdict(self.config.mineru),
+            "parsing_config": dict(self._mineru_config_dict),
         }
 
     def _generate_review(
@@ -184,45 +632,213 @@ class PaperReviewPipeline:
         # Prepare prompt
         prompt = self._prepare_review_prompt(parsed_content, conference)
 
+        # Reuse a cached response for identical requests
+        cache_key = self._review_cache_key(prompt, conference, **kwargs)
+        response = self._get_cached_review(cache_key)
+        if response is not None:
+            return self._compile_review(response, conference, cached=True)
+
         # Generate review
         response = self.llm_client.generate(
-            prompt=prompt,
+            prompt=prompt, **self._generation_kwargs(**kwargs)
+        )
+        # Parse before caching so an unusable response is not stored
+        review = self._compile_review(response, conference)
+        self._set_cached_review(cache_key, response)
+
+        return review
+
+    async def _agenerate_review(
+        self, parsed_content: Dict[str, Any], conference: str = "auto", **kwargs
+    ) -> Dict[str, Any]:
+        """Async variant of :meth:`_generate_review`."""
+        logger.info("Generating review with LLM")
+
+        prompt, request_tokens = self._prepare_review_request(
+            parsed_content, conference
+        )
+
+        cache_key = self._review_cache_key(prompt, conference, **kwargs)
+        response = self._get_cached_review(cache_key)
+        if response is not None:
+            return self._compile_review(response, conference, cached=True)
+
+        if self._rate_limiter is not None:
+            await self._rate_limiter.acquire(request_tokens)
+
+        response = await self.llm_client.agenerate(
+            prompt=prompt, **self._generation_kwargs(**kwargs)
+        )
+        # Parse before caching so an unusable response is not stored
+        review = self._compile_review(response, conference)
+        self._set_cached_review(cache_key, response)
+
+        return review
+
+    def _create_rate_limiter(self):
+        """Rate limiter for concurrent review calls, or None if not configured.
+
+        The limiter is not tied to an event loop, so every loop using this
+        pipeline (e.g. concurrent Streamlit sessions) shares one budget.
+        """
+        llm = self.config.llm
+        if not llm.requests_per_minute and not llm.tokens_per_minute:
+            return None
+
+        from src.llms.rate_limit import AsyncRateLimiter
+
+        return AsyncRateLimiter(
+            requests_per_minute=llm.requests_per_minute,
+            tokens_per_minute=llm.tokens_per_minute,
+        )
+
+    def _generation_kwargs(self, **kwargs) -> Dict[str, Any]:
+        """Generation parameters for a review request, with caller overrides."""
+        options = {
+            "system_prompt": self.config.llm.system_prompt,
+            "temperature": self.config.llm.temperature,
+            "max_tokens": self.config.llm.max_tokens,
+        }
+        if self.config.llm.structured_output:
+            options["response_format"] = {"type": "json_object"}
+        options.update(kwargs)
+        return options
+
+    def _review_cache_key(
+        self, prompt: str, conference: str, **kwargs
+    ) -> Optional[str]:
+        """Build the review cache key, or None if caching is disabled."""
+        if self.review_cache is None:
+            return None
+
+        # Sampled responses are not reproducible, so don't pin one in the cache
+        temperature = kwargs.get("temperature")
+        if temperature is None:
+            temperature = self.config.llm.temperature
+        if temperature > self.config.review_cache_max_temperature:
+            return None
+
+        return ReviewCache.make_key(
+            prompt,
             system_prompt=self.config.llm.system_prompt,
+            model=self.config.llm.model_name,
             temperature=self.config.llm.temperature,
             max_tokens=self.config.llm.max_tokens,
-            **kwargs,
+            structured_output=self.config.llm.structured_output,
+            conference=conference,
+            extra=kwargs,
         )
 
-        # Parse response
+    def _get_cached_review(self, cache_key: Optional[str]) -> Optional[str]:
+        """Look up a cached LLM response."""
+        if cache_key is None:
+            return None
+
+        try:
+            response = self.review_cache.get(cache_key)
+        except Exception as e:
+            logger.warning(f"Failed to read review cache: {e}")
+            return None
+
+        if response is not None:
+            logger.info("Using cached review response")
+        return response
+
+    def _set_cached_review(self, cache_key: Optional[str], response: str):
+        """Store an LLM response in the review cache."""
+        if cache_key is None or response is None:
+            return
+
+        try:
+            self.review_cache.set(cache_key, response)
+        except Exception as e:
+            logger.warning(f"Failed to write review cache: {e}")
+
+    def _compile_review(
+        self, response: str, conference: str, cached: bool = False
+    ) -> Dict[str, Any]:
+        """Parse the LLM response into the review dict."""
         review = self._parse_review_response(response, conference)
 
         return {
             "raw_response": response,
             "parsed_review": review,
-            "llm_config": asdict(self.config.llm),
+            "llm_config": dict(self._llm_config_dict),
+            "cached": cached,
         }
 
     def _prepare_review_prompt(
         self, parsed_content: Dict[str, Any], conference: str
     ) -> str:
         """Prepare a minimal scoring-only prompt for the LLM."""
-        content = parsed_content["content"]
-
-        # Truncate content if too long
-        max_length = 8000  # Leave room for prompt and response
-        if len(content) > max_length:
-            content = content[:max_length] + "\n\n[Content truncated due to length]"
-
-        prompt = (
-            "You are a reviewer for top-tier machine learning conferences. "
-            "Read the paper content below and output only a single integer from 1 to 10 "
-            "that reflects the overall acceptance readiness for a top-tier conference. "
-            "1 = far below bar, 5 = borderline/uncertain, 10 = award-level. "
-            "Output exactly the integer only, with no words or symbols.\n\n"
-            "Paper Content:\n" + content
+        return self._prepare_review_request(parsed_content, conference)[0]
+
+    def _prepare_review_request(
+        self, parsed_content: Dict[str, Any], conference: str
+    ) -> Tuple[str, int]:
+        """Build the review prompt and count the tokens the request will use.
+
+        The count (system prompt + prompt + ``max_tokens``) comes from the
+        truncation pass, so rate limiting doesn't need to encode the prompt again.
+        """
+        system_tokens = self._count_static_tokens(self.config.llm.system_prompt or "")
+        header_tokens = self._count_static_tokens(self._PROMPT_HEADER)
+
+        # Truncate content to what fits in the model context
+        budget = (
+            self.config.llm.context_window
+            - self.config.llm.max_tokens
+            - system_tokens
+            - header_tokens
+        )
+        content, content_tokens = self._truncate_content(
+            parsed_content["content"], budget
+        )
+
+        request_tokens = (
+            system_tokens + header_tokens + content_tokens + self.config.llm.max_tokens
         )
+        return self._PROMPT_HEADER + content, request_tokens
+
+    def _get_encoding(self):
+        """Lazily load the tokenizer used for prompt budgeting, or None."""
+        return _load_encoding(self.config.llm.model_name)
+
+    def _count_tokens(self, text: str) -> int:
+        """Count tokens in ``text``, estimating if no tokenizer is available."""
+        encoding = self._get_encoding()
+        if encoding is None:
+            return len(text) // _CHARS_PER_TOKEN + 1
+        return len(encoding.encode(text, disallowed_special=()))
 
-        return prompt
+    def _count_static_tokens(self, text: str) -> int:
+        """Like :meth:`_count_tokens`, memoized for prompt parts reused every call."""
+        count = self._static_token_counts.get(text)
+        if count is None:
+            count = self._static_token_counts[text] = self._count_tokens(text)
+        return count
+
+    def _truncate_content(self, content: str, budget: int) -> Tuple[str, int]:
+        """Truncate paper content to at most ``budget`` tokens.
+
+        Returns:
+            The (possibly truncated) content and its token count
+        """
+        marker = self._TRUNCATION_MARKER
+        marker_tokens = self._count_static_tokens(marker)
+        budget = max(budget - marker_tokens, 0)
+
+        encoding = self._get_encoding()
+        if encoding is None:
+            truncated = content[: budget * _CHARS_PER_TOKEN]
+            tokens = len(truncated) // _CHARS_PER_TOKEN + 1
+        else:
+            truncated, tokens = _truncate_to_tokens(encoding, content, budget)
+
+        if len(truncated) < len(content):
+            truncated += marker
+            tokens += marker_tokens
+        return truncated, tokens
 
     def _get_conference_info(self, conference: str) -> Dict[str, Any]:
         """Get information about the target conference."""
@@ -250,26 +866,36 @@ class PaperReviewPipeline:
         }
 
     def _parse_review_response(self, response: str, conference: str) -> Dict[str, Any]:
-        """Parse the LLM response expecting a single integer 1-10."""
-        import re
+        """Parse the LLM response, expecting {"score": <int 1-10>}.
 
+        Raises:
+            ReviewParseError: If the response contains no score from 1 to 10
+        """
+        text = (response or "").strip()
         try:
-            text = (response or "").strip()
-            # First try exact integer in the whole response
-            if re.fullmatch(r"(10|[1-9])", text):
-                score = int(text)
-            else:
-                # Fallback: find the first standalone 1-10 integer
-                m = re.search(r"\b(10|[1-9])\b", text)
-                score = int(m.group(1)) if m else 5
+            data = orjson.loads(text)
+        except orjson.JSONDecodeError:
+            # Plain-text fallback for providers that ignore response_format,
+            # e.g. a fenced JSON block or a sentence around the score
+            m = _SCORE_SEARCH.search(text)
+            score = int(m.group(1)) if m else None
+        else:
+            score = self._score_from_json(data)
 
-            # Clamp to 1-10 just in case
-            score = max(1, min(10, score))
+        if score is None or not 1 <= score <= 10:
+            raise ReviewParseError(
+                f"No score from 1 to 10 in LLM response: {text[:200]!r}"
+            )
 
-            return {"score": score}
-        except Exception as e:
-            logger.warning(f"Failed to parse score from response: {e}")
-            return {"score": 5, "parsing_error": str(e)}
+        return {"score": score}
+
+    @staticmethod
+    def _score_from_json(data: Any) -> Optional[int]:
+        """Return the score from a decoded JSON-mode response, or None if absent."""
+        score = data.get("score") if isinstance(data, dict) else data
+        if isinstance(score, bool) or not isinstance(score, (int, float)):
+            return None
+        return int(score)
 
     def _save_results(self, result: Dict[str, Any], input_path: str):
         """Save review results to file."""
@@ -285,19 +911,39 @@ class PaperReviewPipeline:
             )
 
             if self.config.output_format == "json":
-                with open(output_file, "w", encoding="utf-8") as f:
-                    json.dump(result, f, indent=2, ensure_ascii=False)
+                with open(output_file, "wb") as f:
+                    f.write(
+                        orjson.dumps(
+                            self._result_for_saving(result),
+                            default=str,
+                            option=_JSON_OPTIONS,
+                        )
+                    )
             elif self.config.output_format == "markdown":
                 self._save_as_markdown(result, output_file)
             else:
                 with open(output_file, "w", encoding="utf-8") as f:
-                    f.write(str(result))
+                    f.write(str(self._result_for_saving(result)))
 
             logger.info(f"Results saved to: {output_file}")
 
         except Exception as e:
             logger.error(f"Failed to save results: {e}")
 
+    def _result_for_saving(self, result: Dict[str, Any]) -> Dict[str, Any]:
+        """Drop the parsed markdown from saved results unless configured to keep it.
+
+        The markdown already lives at ``parsed_content["output_file"]``, so
+        embedding it again only duplicates the largest part of the result.
+        """
+        if self.config.save_parsed_content or "parsed_content" not in result:
+            return result
+
+        parsed_content = {
+            k: v for k, v in result["parsed_content"].items() if k != "content"
+        }
+        return {**result, "parsed_content": parsed_content}
+
     def _save_as_markdown(self, result: Dict[str, Any], output_file: Path):
         """Save results in markdown format."""
         with open(output_file, "w", encoding="utf-8") as f:
@@ -325,8 +971,6 @@ class PaperReviewPipeline:
 
     def _get_timestamp(self) -> str:
         """Get current timestamp."""
-        from datetime import datetime
-
         return datetime.now().isoformat()
 
     def save_pretrained(self, save_directory: str):
@@ -336,8 +980,8 @@ class PaperReviewPipeline:
 
         # Save config
         config_file = save_directory / "config.json"
-        with open(config_file, "w") as f:
-            json.dump(asdict(self.config), f, indent=2)
+        with open(config_file, "wb") as f:
+            f.write(orjson.dumps(asdict(self.config), default=str, option=_JSON_OPTIONS))
 
         logger.info(f"Pipeline configuration saved to: {save_directory}")
 
@@ -349,8 +993,8 @@ class PaperReviewPipeline:
         if not config_file.exists():
             raise ValueError(f"Configuration file not found: {config_file}")
 
-        with open(config_file, "r") as f:
-            config_dict = json.load(f)
+        with open(config_file, "rb") as f:
+            config_dict = orjson.loads(f.read())
 
         # Reconstruct config objects
         mineru_config = MinerUConfig(**config_dict["mineru"])
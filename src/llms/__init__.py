@@ -6,6 +6,7 @@ from .openrouter_client import (
 from .dashscope_client import (
     DashScopeClient,
     DashScopeConfig,
+    DashScopeError,
     create_dashscope_client_from_env,
 )
 
@@ -15,5 +16,6 @@ __all__ = [
     "create_client_from_env",
     "DashScopeClient",
     "DashScopeConfig",
+    "DashScopeError",
     "create_dashscope_client_from_env",
 ]
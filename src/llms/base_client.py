@@ -0,0 +1,94 @@
+"""
+Common plumbing for the clients of OpenAI-compatible chat APIs.
+"""
+
+import asyncio
+import threading
+import weakref
+from typing import Optional, Dict, Any, List
+
+import openai
+
+from .http_client import shared_http_client, shared_async_http_client
+
+
+class OpenAICompatibleClient:
+    """Base class for clients that talk to a provider through the OpenAI SDK.
+
+    Subclasses set ``self.config`` (``api_key``, ``base_url``,
+    ``default_model``, ``temperature``, ``max_tokens``) and then call
+    :meth:`_init_clients`.
+    """
+
+    def _init_clients(self) -> None:
+        """Create the SDK clients and the per-request parameter defaults."""
+        self.client = openai.OpenAI(
+            api_key=self.config.api_key,
+            base_url=self.config.base_url,
+            http_client=shared_http_client(),
+        )
+        self._async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, openai.AsyncOpenAI]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._async_clients_lock = threading.Lock()
+        # Defaults for every request, built once (see _request_params)
+        self._default_params = {
+            "model": self.config.default_model,
+            "temperature": self.config.temperature,
+            "max_tokens": self.config.max_tokens,
+        }
+
+    @property
+    def async_client(self) -> openai.AsyncOpenAI:
+        """Async OpenAI client bound to the currently running event loop.
+
+        All LLM clients on the same loop share one connection pool. Pools
+        cannot cross event loops, so there is one client per loop (e.g. for
+        successive ``asyncio.run`` calls, or threads each running their own
+        loop); it is dropped together with the loop.
+        """
+        loop = asyncio.get_running_loop()
+
+        with self._async_clients_lock:
+            client = self._async_clients.get(loop)
+            if client is None:
+                client = self._async_clients[loop] = openai.AsyncOpenAI(
+                    api_key=self.config.api_key,
+                    base_url=self.config.base_url,
+                    http_client=shared_async_http_client(),
+                )
+            return client
+
+    def _request_params(
+        self,
+        model: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        **kwargs,
+    ) -> Dict[str, Any]:
+        """Config defaults overridden by any explicitly passed parameters.
+
+        ``None`` means "use the default", so e.g. ``temperature=0`` is kept.
+        """
+        params = self._default_params.copy()
+        if model is not None:
+            params["model"] = model
+        if temperature is not None:
+            params["temperature"] = temperature
+        if max_tokens is not None:
+            params["max_tokens"] = max_tokens
+        params.update(kwargs)
+        return params
+
+    @staticmethod
+    def _build_messages(
+        prompt: str, system_prompt: Optional[str] = None
+    ) -> List[Dict[str, str]]:
+        """Build the chat messages for a single-turn prompt."""
+        messages: List[Dict[str, str]] = []
+
+        if system_prompt:
+            messages.append({"role": "system", "content": system_prompt})
+
+        messages.append({"role": "user", "content": prompt})
+        return messages
@@ -1,8 +1,17 @@
 import os
-import openai
-from typing import Optional, Dict, Any, List
+import time
+import functools
+import orjson
+from typing import Optional, Dict, Any, List, Iterator
 from dataclasses import dataclass
 
+from .base_client import OpenAICompatibleClient
+from .usage import usage_dict
+
+
+class DashScopeError(Exception):
+    """Raised when a DashScope API request fails."""
+
 
 @dataclass
 class DashScopeConfig:
@@ -15,7 +24,7 @@ class DashScopeConfig:
     temperature: float = 0.7
 
 
-class DashScopeClient:
+class DashScopeClient(OpenAICompatibleClient):
     """Client for interacting with Aliyun DashScope (Qwen) via OpenAI-compatible API."""
 
     def __init__(
@@ -44,9 +53,7 @@ class DashScopeClient:
                 api_key=api_key, default_model=model or "qwen-plus"
             )
 
-        self.client = openai.OpenAI(
-            api_key=self.config.api_key, base_url=self.config.base_url
-        )
+        self._init_clients()
 
     def generate(
         self,
@@ -69,25 +76,71 @@ class DashScopeClient:
 
         Returns:
             Generated text response
+
+        Raises:
+            DashScopeError: If the request fails
         """
-        messages: List[Dict[str, str]] = []
+        response = self._create_chat_completion(
+            messages=self._build_messages(prompt, system_prompt),
+            temperature=temperature,
+            max_tokens=max_tokens,
+            **kwargs,
+        )
+        return response.choices[0].message.content
 
-        if system_prompt:
-            messages.append({"role": "system", "content": system_prompt})
+    def stream_generate(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        **kwargs,
+    ) -> Iterator[str]:
+        """Generate text incrementally using the streaming endpoint.
 
-        messages.append({"role": "user", "content": prompt})
+        Args:
+            prompt: The user prompt
+            system_prompt: Optional system prompt
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens to generate
+            **kwargs: Additional parameters
+
+        Yields:
+            Text deltas as they arrive
+
+        Raises:
+            DashScopeError: If the request fails
+        """
+        try:
+            stream = self.client.chat.completions.create(
+                messages=self._build_messages(prompt, system_prompt),
+                stream=True,
+                **self._request_params(
+                    temperature=temperature, max_tokens=max_tokens, **kwargs
+                ),
+            )
+            for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+        except Exception as e:
+            raise DashScopeError(f"Generation failed: {e}") from e
 
-        result = self.chat_completion(
-            messages=messages,
-            temperature=temperature or self.config.temperature,
-            max_tokens=max_tokens or self.config.max_tokens,
+    async def agenerate(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        **kwargs,
+    ) -> str:
+        """Async variant of :meth:`generate`."""
+        response = await self._acreate_chat_completion(
+            messages=self._build_messages(prompt, system_prompt),
+            temperature=temperature,
+            max_tokens=max_tokens,
             **kwargs,
         )
-
-        if result["success"]:
-            return result["content"]
-        else:
-            raise Exception(f"Generation failed: {result['error']}")
+        return response.choices[0].message.content
 
     def chat_completion(
         self,
@@ -110,20 +163,14 @@ class DashScopeClient:
             API response dictionary
         """
         try:
-            response = self.client.chat.completions.create(
-                model=model or self.config.default_model,
-                messages=messages,
-                temperature=temperature or self.config.temperature,
-                max_tokens=max_tokens or self.config.max_tokens,
-                **kwargs,
+            response = self._create_chat_completion(
+                messages, model, temperature, max_tokens, **kwargs
             )
             return {
                 "success": True,
                 "response": response,
                 "content": response.choices[0].message.content,
-                "usage": (
-                    response.usage.dict() if getattr(response, "usage", None) else None
-                ),
+                "usage": usage_dict(getattr(response, "usage", None)),
             }
         except Exception as e:
             return {
@@ -134,6 +181,68 @@ class DashScopeClient:
                 "usage": None,
             }
 
+    async def achat_completion(
+        self,
+        messages: List[Dict[str, str]],
+        model: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        **kwargs,
+    ) -> Dict[str, Any]:
+        """Async variant of :meth:`chat_completion` using ``openai.AsyncOpenAI``."""
+        try:
+            response = await self._acreate_chat_completion(
+                messages, model, temperature, max_tokens, **kwargs
+            )
+            return {
+                "success": True,
+                "response": response,
+                "content": response.choices[0].message.content,
+                "usage": usage_dict(getattr(response, "usage", None)),
+            }
+        except Exception as e:
+            return {
+                "success": False,
+                "error": str(e),
+                "response": None,
+                "content": None,
+                "usage": None,
+            }
+
+    def _create_chat_completion(
+        self,
+        messages: List[Dict[str, str]],
+        model: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        **kwargs,
+    ):
+        """Call the chat completions endpoint, raising DashScopeError on failure."""
+        try:
+            return self.client.chat.completions.create(
+                messages=messages,
+                **self._request_params(model, temperature, max_tokens, **kwargs),
+            )
+        except Exception as e:
+            raise DashScopeError(str(e)) from e
+
+    async def _acreate_chat_completion(
+        self,
+        messages: List[Dict[str, str]],
+        model: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        **kwargs,
+    ):
+        """Async variant of :meth:`_create_chat_completion`."""
+        try:
+            return await self.async_client.chat.completions.create(
+                messages=messages,
+                **self._request_params(model, temperature, max_tokens, **kwargs),
+            )
+        except Exception as e:
+            raise DashScopeError(str(e)) from e
+
     def text_completion(
         self,
         prompt: str,
@@ -156,19 +265,14 @@ class DashScopeClient:
         """
         try:
             response = self.client.completions.create(
-                model=model or self.config.default_model,
                 prompt=prompt,
-                temperature=temperature or self.config.temperature,
-                max_tokens=max_tokens or self.config.max_tokens,
-                **kwargs,
+                **self._request_params(model, temperature, max_tokens, **kwargs),
             )
             return {
                 "success": True,
                 "response": response,
                 "content": response.choices[0].text,
-                "usage": (
-                    response.usage.dict() if getattr(response, "usage", None) else None
-                ),
+                "usage": usage_dict(getattr(response, "usage", None)),
             }
         except Exception as e:
             return {
@@ -179,6 +283,153 @@ class DashScopeClient:
                 "usage": None,
             }
 
+    def submit_batch(
+        self,
+        prompts: List[str],
+        system_prompt: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        **kwargs,
+    ) -> str:
+        """Submit prompts to the DashScope batch inference endpoint.
+
+        Each prompt becomes one chat-completion request whose ``custom_id`` is
+        its index in ``prompts``.
+
+        Args:
+            prompts: User prompts to complete
+            system_prompt: Optional system prompt shared by all requests
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens to generate
+            **kwargs: Additional parameters added to every request body
+
+        Returns:
+            ID of the created batch job
+        """
+        params = self._request_params(
+            temperature=temperature, max_tokens=max_tokens, **kwargs
+        )
+        lines = []
+        for idx, prompt in enumerate(prompts):
+            body = {
+                "messages": self._build_messages(prompt, system_prompt),
+                **params,
+            }
+            lines.append(
+                orjson.dumps(
+                    {
+                        "custom_id": str(idx),
+                        "method": "POST",
+                        "url": "/v1/chat/completions",
+                        "body": body,
+                    }
+                )
+            )
+        # orjson emits UTF-8 bytes directly, so the file is built without re-encoding
+        data = b"\n".join(lines) + b"\n"
+
+        input_file = self.client.files.create(
+            file=("batch_input.jsonl", data), purpose="batch"
+        )
+        batch = self.client.batches.create(
+            input_file_id=input_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h",
+        )
+        return batch.id
+
+    def retrieve_batch(self, batch_id: str):
+        """Get the current state of a batch job."""
+        return self.client.batches.retrieve(batch_id)
+
+    def wait_for_batch(
+        self,
+        batch_id: str,
+        max_wait_time: int = 86400,
+        initial_interval: float = 5.0,
+        max_interval: float = 300.0,
+    ):
+        """Poll a batch job with exponential backoff until it finishes."""
+        start_time = time.time()
+        interval = initial_interval
+
+        while time.time() - start_time < max_wait_time:
+            batch = self.retrieve_batch(batch_id)
+            if batch.status == "completed":
+                return batch
+            if batch.status in ("failed", "expired", "cancelled"):
+                raise DashScopeError(
+                    f"Batch {batch_id} ended with status: {batch.status}"
+                )
+
+            time.sleep(interval)
+            interval = min(interval * 2, max_interval)
+
+        raise TimeoutError(
+            f"Batch {batch_id} did not complete within {max_wait_time} seconds"
+        )
+
+    def batch_generate(
+        self,
+        prompts: List[str],
+        system_prompt: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        max_wait_time: int = 86400,
+        **kwargs,
+    ) -> List[Dict[str, Any]]:
+        """Complete prompts through the batch endpoint and wait for the results.
+
+        Args:
+            prompts: User prompts to complete
+            system_prompt: Optional system prompt shared by all requests
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens to generate
+            max_wait_time: Maximum time to wait for the batch (seconds)
+            **kwargs: Additional parameters added to every request body
+
+        Returns:
+            One result dictionary per prompt, in input order
+        """
+        batch_id = self.submit_batch(
+            prompts,
+            system_prompt=system_prompt,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            **kwargs,
+        )
+        batch = self.wait_for_batch(batch_id, max_wait_time=max_wait_time)
+
+        results: List[Dict[str, Any]] = [
+            {"success": False, "content": None, "error": "Missing from batch output"}
+            for _ in prompts
+        ]
+        for file_id in (batch.output_file_id, batch.error_file_id):
+            if not file_id:
+                continue
+            for line in self.client.files.content(file_id).content.splitlines():
+                if not line.strip():
+                    continue
+                record = orjson.loads(line)
+                idx = int(record["custom_id"])
+                response = record.get("response") or {}
+                if response.get("status_code") == 200:
+                    body = response["body"]
+                    results[idx] = {
+                        "success": True,
+                        "content": body["choices"][0]["message"]["content"],
+                        "error": None,
+                    }
+                else:
+                    error = record.get("error") or response.get("body")
+                    results[idx] = {
+                        "success": False,
+                        "content": None,
+                        "error": str(error),
+                    }
+
+        return results
+
     def list_models(self) -> Dict[str, Any]:
         """List available models from DashScope.
 
@@ -214,6 +465,9 @@ class DashScopeClient:
 def create_dashscope_client_from_env() -> DashScopeClient:
     """Create a DashScope client using environment variables.
 
+    The client is shared between calls with the same API key, so repeated
+    callers reuse one connection pool.
+
     Required environment variables:
     - DASHSCOPE_API_KEY: Your DashScope API key
 
@@ -224,8 +478,13 @@ def create_dashscope_client_from_env() -> DashScopeClient:
     if not api_key:
         raise ValueError("DASHSCOPE_API_KEY environment variable is required")
 
-    config = DashScopeConfig(api_key=api_key)
-    return DashScopeClient(config=config)
+    return _shared_client(api_key)
+
+
+@functools.lru_cache(maxsize=1)
+def _shared_client(api_key: str) -> DashScopeClient:
+    """Build the client returned by :func:`create_dashscope_client_from_env`."""
+    return DashScopeClient(config=DashScopeConfig(api_key=api_key))
 
 
 if __name__ == "__main__":
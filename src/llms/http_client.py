@@ -0,0 +1,77 @@
+"""
+Pooled HTTP clients shared by the OpenAI-compatible LLM clients.
+"""
+
+import atexit
+import asyncio
+import threading
+import weakref
+from typing import Optional
+
+import httpx
+import openai
+
+# Enough connections for the pipeline's concurrent reviews, so each request
+# reuses an open TLS connection instead of handshaking again
+POOL_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=50)
+
+
+def _http2_available() -> bool:
+    """HTTP/2 needs the optional ``h2`` package (``pip install httpx[http2]``)."""
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+HTTP2 = _http2_available()
+
+_shared_client: Optional[httpx.Client] = None
+_shared_lock = threading.Lock()
+_shared_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def create_http_client() -> httpx.Client:
+    """Sync client for ``openai.OpenAI(http_client=...)``.
+
+    Built on the SDK's default client so its timeouts and redirect handling
+    are kept; only the pool size and HTTP/2 are changed.
+    """
+    return openai.DefaultHttpxClient(http2=HTTP2, limits=POOL_LIMITS)
+
+
+def shared_http_client() -> httpx.Client:
+    """Process-wide sync client, so every LLM client reuses one connection pool.
+
+    The client is closed at interpreter exit; callers must not close it.
+    """
+    global _shared_client
+
+    with _shared_lock:
+        if _shared_client is None or _shared_client.is_closed:
+            _shared_client = create_http_client()
+            atexit.register(_shared_client.close)
+        return _shared_client
+
+
+def create_async_http_client() -> httpx.AsyncClient:
+    """Async counterpart of :func:`create_http_client`."""
+    return openai.DefaultAsyncHttpxClient(http2=HTTP2, limits=POOL_LIMITS)
+
+
+def shared_async_http_client() -> httpx.AsyncClient:
+    """Async client shared by every LLM client on the running event loop.
+
+    Async pools are bound to the loop they were created on, so there is one
+    per loop; it is dropped together with the loop.
+    """
+    loop = asyncio.get_running_loop()
+
+    with _shared_lock:
+        client = _shared_async_clients.get(loop)
+        if client is None or client.is_closed:
+            client = _shared_async_clients[loop] = create_async_http_client()
+        return client
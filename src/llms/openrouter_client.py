@@ -1,8 +1,23 @@
 import os
+import json
+import time
+import asyncio
+import hashlib
+import contextlib
+import tempfile
+import threading
 import openai
+from openai.types.chat import ChatCompletion
+from pathlib import Path
+from collections import OrderedDict
 from typing import Optional, Dict, Any, List
 from dataclasses import dataclass
 
+from .base_client import OpenAICompatibleClient
+from .usage import usage_dict
+from .rate_limit import AsyncRateLimiter
+from src.utils.async_utils import run_sync
+
 
 @dataclass
 class OpenRouterConfig:
@@ -13,9 +28,21 @@ class OpenRouterConfig:
     default_model: str = "anthropic/claude-3.5-sonnet"
     max_tokens: int = 1000
     temperature: float = 0.7
+    response_cache_size: int = 256  # deterministic responses kept in memory; 0 disables
+    disk_cache_enabled: bool = False  # also persist deterministic responses to disk
+    disk_cache_dir: str = "~/.cache/reviewer2/openrouter"
+    disk_cache_ttl_seconds: int = 7 * 24 * 3600
+
+
+# Requests at or below this temperature are treated as deterministic and cached
+DETERMINISTIC_TEMPERATURE = 0.01
+
+# Model families that only reuse a cached prompt prefix when it is marked with
+# an explicit cache_control breakpoint (others cache prefixes automatically)
+CACHE_CONTROL_MODEL_PREFIXES = ("anthropic/",)
 
 
-class OpenRouterClient:
+class OpenRouterClient(OpenAICompatibleClient):
     """Client for interacting with OpenRouter.ai LLM models."""
 
     def __init__(
@@ -44,9 +71,91 @@ class OpenRouterClient:
                 api_key=api_key, default_model=model or "anthropic/claude-3.5-sonnet"
             )
 
-        self.client = openai.OpenAI(
-            api_key=self.config.api_key, base_url=self.config.base_url
+        self._init_clients()
+        self._response_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+
+    def _build_prefixed_messages(
+        self,
+        static_system: Optional[str],
+        static_user_prefix: str,
+        dynamic_user_suffix: str,
+        model: str,
+    ) -> List[Dict[str, Any]]:
+        """Build messages with all static text ahead of the per-request text.
+
+        For models that need it, the static part ends in a ``cache_control``
+        breakpoint so the provider caches the system prompt and user prefix.
+        """
+        if not model.startswith(CACHE_CONTROL_MODEL_PREFIXES):
+            return self._build_messages(
+                static_user_prefix + dynamic_user_suffix, static_system
+            )
+
+        breakpoint_block = {"cache_control": {"type": "ephemeral"}}
+        messages: List[Dict[str, Any]] = []
+        if static_system:
+            system_block = {"type": "text", "text": static_system}
+            if not static_user_prefix:
+                system_block.update(breakpoint_block)
+            messages.append({"role": "system", "content": [system_block]})
+
+        user_blocks: List[Dict[str, Any]] = []
+        if static_user_prefix:
+            user_blocks.append(
+                {"type": "text", "text": static_user_prefix, **breakpoint_block}
+            )
+        user_blocks.append({"type": "text", "text": dynamic_user_suffix})
+        messages.append({"role": "user", "content": user_blocks})
+        return messages
+
+    def generate_with_prefix(
+        self,
+        static_system: Optional[str],
+        static_user_prefix: str,
+        dynamic_user_suffix: str,
+        model: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        **kwargs,
+    ) -> str:
+        """Generate text from a prompt split into a shared prefix and a per-call suffix.
+
+        Providers cache the longest repeated prompt prefix, so keeping the
+        instructions in ``static_system``/``static_user_prefix`` and only the
+        varying content (e.g. the paper) in ``dynamic_user_suffix`` lets
+        repeated calls reuse the cached prefix at lower cost and latency.
+
+        Args:
+            static_system: System prompt shared by all calls
+            static_user_prefix: Start of the user message shared by all calls
+            dynamic_user_suffix: Per-call rest of the user message, appended as is
+            model: Model to use (defaults to config default_model)
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens to generate
+            **kwargs: Additional parameters
+
+        Returns:
+            Generated text response
+        """
+        messages = self._build_prefixed_messages(
+            static_system,
+            static_user_prefix,
+            dynamic_user_suffix,
+            model or self.config.default_model,
         )
+        result = self.chat_completion(
+            messages=messages,
+            model=model,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            **kwargs,
+        )
+
+        if result["success"]:
+            return result["content"]
+        else:
+            raise Exception(f"Generation failed: {result['error']}")
 
     def generate(
         self,
@@ -70,17 +179,31 @@ class OpenRouterClient:
         Returns:
             Generated text response
         """
-        messages = []
-
-        if system_prompt:
-            messages.append({"role": "system", "content": system_prompt})
+        result = self.chat_completion(
+            messages=self._build_messages(prompt, system_prompt),
+            temperature=temperature,
+            max_tokens=max_tokens,
+            **kwargs,
+        )
 
-        messages.append({"role": "user", "content": prompt})
+        if result["success"]:
+            return result["content"]
+        else:
+            raise Exception(f"Generation failed: {result['error']}")
 
-        result = self.chat_completion(
-            messages=messages,
-            temperature=temperature or self.config.temperature,
-            max_tokens=max_tokens or self.config.max_tokens,
+    async def agenerate(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        **kwargs,
+    ) -> str:
+        """Async variant of :meth:`generate`."""
+        result = await self.achat_completion(
+            messages=self._build_messages(prompt, system_prompt),
+            temperature=temperature,
+            max_tokens=max_tokens,
             **kwargs,
         )
 
@@ -89,6 +212,59 @@ class OpenRouterClient:
         else:
             raise Exception(f"Generation failed: {result['error']}")
 
+    async def agenerate_many(
+        self,
+        prompts: List[str],
+        system_prompt: Optional[str] = None,
+        concurrency: int = 10,
+        requests_per_minute: Optional[float] = None,
+        **kwargs,
+    ) -> List[Dict[str, Any]]:
+        """Run many single-turn prompts concurrently.
+
+        Args:
+            prompts: User prompts to send
+            system_prompt: Optional system prompt shared by all requests
+            concurrency: Maximum number of requests in flight
+            requests_per_minute: Optional client-side rate limit
+            **kwargs: Parameters passed to :meth:`achat_completion`
+
+        Returns:
+            One :meth:`achat_completion` result dict per prompt, in order; a
+            failed request does not cancel the others
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        limiter = AsyncRateLimiter(requests_per_minute) if requests_per_minute else None
+
+        async def run(prompt: str) -> Dict[str, Any]:
+            async with semaphore:
+                if limiter is not None:
+                    await limiter.acquire()
+                return await self.achat_completion(
+                    messages=self._build_messages(prompt, system_prompt), **kwargs
+                )
+
+        return await asyncio.gather(*(run(prompt) for prompt in prompts))
+
+    def generate_many(
+        self,
+        prompts: List[str],
+        system_prompt: Optional[str] = None,
+        concurrency: int = 10,
+        requests_per_minute: Optional[float] = None,
+        **kwargs,
+    ) -> List[Dict[str, Any]]:
+        """Sync wrapper around :meth:`agenerate_many` for non-async callers."""
+        return run_sync(
+            self.agenerate_many(
+                prompts,
+                system_prompt=system_prompt,
+                concurrency=concurrency,
+                requests_per_minute=requests_per_minute,
+                **kwargs,
+            )
+        )
+
     def chat_completion(
         self,
         messages: List[Dict[str, str]],
@@ -109,20 +285,58 @@ class OpenRouterClient:
         Returns:
             API response dictionary
         """
+        params = self._request_params(model, temperature, max_tokens, **kwargs)
+        cache_key = self._cache_key(messages, params)
+        cached = self._get_cached(cache_key)
+        if cached is not None:
+            return cached
+
         try:
-            response = self.client.chat.completions.create(
-                model=model or self.config.default_model,
-                messages=messages,
-                temperature=temperature or self.config.temperature,
-                max_tokens=max_tokens or self.config.max_tokens,
-                **kwargs,
-            )
+            response = self.client.chat.completions.create(messages=messages, **params)
+            result = {
+                "success": True,
+                "response": response,
+                "content": response.choices[0].message.content,
+                "usage": usage_dict(response.usage),
+            }
+            self._set_cached(cache_key, result)
+            return result
+        except Exception as e:
             return {
+                "success": False,
+                "error": str(e),
+                "response": None,
+                "content": None,
+                "usage": None,
+            }
+
+    async def achat_completion(
+        self,
+        messages: List[Dict[str, str]],
+        model: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        **kwargs,
+    ) -> Dict[str, Any]:
+        """Async variant of :meth:`chat_completion` using ``openai.AsyncOpenAI``."""
+        params = self._request_params(model, temperature, max_tokens, **kwargs)
+        cache_key = self._cache_key(messages, params)
+        cached = self._get_cached(cache_key)
+        if cached is not None:
+            return cached
+
+        try:
+            response = await self.async_client.chat.completions.create(
+                messages=messages, **params
+            )
+            result = {
                 "success": True,
                 "response": response,
                 "content": response.choices[0].message.content,
-                "usage": response.usage.dict() if response.usage else None,
+                "usage": usage_dict(response.usage),
             }
+            self._set_cached(cache_key, result)
+            return result
         except Exception as e:
             return {
                 "success": False,
@@ -132,6 +346,109 @@ class OpenRouterClient:
                 "usage": None,
             }
 
+    def _cache_key(
+        self, messages: List[Dict[str, str]], params: Dict[str, Any]
+    ) -> Optional[str]:
+        """Exact-match key for a deterministic chat request, or None if uncacheable."""
+        if self.config.response_cache_size <= 0 and not self.config.disk_cache_enabled:
+            return None
+        if params.get("stream"):
+            return None
+        if params["temperature"] > DETERMINISTIC_TEMPERATURE:
+            return None
+
+        payload = json.dumps(
+            {"messages": messages, **params}, sort_keys=True, default=str
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _get_cached(self, cache_key: Optional[str]) -> Optional[Dict[str, Any]]:
+        """Return a copy of the cached result for ``cache_key``, or None."""
+        if cache_key is None:
+            return None
+
+        with self._cache_lock:
+            result = self._response_cache.get(cache_key)
+            if result is not None:
+                self._response_cache.move_to_end(cache_key)
+                return dict(result)
+
+        result = self._read_disk_cache(cache_key)
+        if result is not None:
+            self._remember(cache_key, result)
+        return result
+
+    def _set_cached(self, cache_key: Optional[str], result: Dict[str, Any]):
+        """Store a successful result in memory and, if enabled, on disk."""
+        if cache_key is None:
+            return
+
+        self._remember(cache_key, result)
+        self._write_disk_cache(cache_key, result)
+
+    def _remember(self, cache_key: str, result: Dict[str, Any]):
+        """Add a result to the in-memory LRU, evicting the oldest if full."""
+        if self.config.response_cache_size <= 0:
+            return
+
+        with self._cache_lock:
+            self._response_cache[cache_key] = result
+            self._response_cache.move_to_end(cache_key)
+            while len(self._response_cache) > self.config.response_cache_size:
+                self._response_cache.popitem(last=False)
+
+    def _disk_cache_path(self, cache_key: str) -> Path:
+        """File holding the disk cache entry for ``cache_key``."""
+        return Path(self.config.disk_cache_dir).expanduser() / f"{cache_key}.json"
+
+    def _read_disk_cache(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        """Load an unexpired result from the disk cache, or None."""
+        if not self.config.disk_cache_enabled:
+            return None
+
+        path = self._disk_cache_path(cache_key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+
+            if time.time() - entry["created_at"] > self.config.disk_cache_ttl_seconds:
+                return None
+
+            return {
+                "success": True,
+                "response": ChatCompletion.construct(**entry["response"]),
+                "content": entry["content"],
+                "usage": entry["usage"],
+            }
+        except (OSError, ValueError, KeyError, TypeError):
+            # Missing, corrupt or outdated entries are treated as a miss
+            return None
+
+    def _write_disk_cache(self, cache_key: str, result: Dict[str, Any]):
+        """Atomically persist a result to the disk cache."""
+        if not self.config.disk_cache_enabled:
+            return
+
+        path = self._disk_cache_path(cache_key)
+        tmp_path = None
+        try:
+            entry = {
+                "created_at": time.time(),
+                "response": result["response"].to_dict(mode="json"),
+                "content": result["content"],
+                "usage": result["usage"],
+            }
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(entry, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except (OSError, TypeError, ValueError):
+            # Caching is best-effort; the response itself was already obtained
+            if tmp_path is not None:
+                with contextlib.suppress(OSError):
+                    os.unlink(tmp_path)
+
     def text_completion(
         self,
         prompt: str,
@@ -154,17 +471,14 @@ class OpenRouterClient:
         """
         try:
             response = self.client.completions.create(
-                model=model or self.config.default_model,
                 prompt=prompt,
-                temperature=temperature or self.config.temperature,
-                max_tokens=max_tokens or self.config.max_tokens,
-                **kwargs,
+                **self._request_params(model, temperature, max_tokens, **kwargs),
             )
             return {
                 "success": True,
                 "response": response,
                 "content": response.choices[0].text,
-                "usage": response.usage.dict() if response.usage else None,
+                "usage": usage_dict(response.usage),
             }
         except Exception as e:
             return {
@@ -0,0 +1,54 @@
+"""
+Client-side request rate limiting for the async LLM helpers.
+"""
+
+import time
+import asyncio
+import threading
+from typing import Optional
+
+
+class AsyncRateLimiter:
+    """Spaces out coroutine calls to stay under a request and/or token rate.
+
+    Each :meth:`acquire` reserves the next free slot and sleeps until it, so
+    bursts from ``asyncio.gather`` are smoothed out instead of tripping the
+    provider's rate limit. Slots are reserved under a thread lock and only the
+    wait happens on the caller's loop, so one limiter can be shared by several
+    event loops and threads and they all draw from the same budget.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: Optional[float] = None,
+        tokens_per_minute: Optional[float] = None,
+    ):
+        """
+        Initialize the rate limiter.
+
+        Args:
+            requests_per_minute: Maximum request rate, or None for no limit
+            tokens_per_minute: Maximum token rate (prompt + completion), or None
+        """
+        if not requests_per_minute and not tokens_per_minute:
+            raise ValueError("Set requests_per_minute and/or tokens_per_minute")
+        if (requests_per_minute or 0) < 0 or (tokens_per_minute or 0) < 0:
+            raise ValueError("Rate limits must be positive")
+
+        self.request_interval = 60.0 / requests_per_minute if requests_per_minute else 0.0
+        self.token_interval = 60.0 / tokens_per_minute if tokens_per_minute else 0.0
+        self._next_request_slot = 0.0
+        self._next_token_slot = 0.0
+        self._lock = threading.Lock()
+
+    async def acquire(self, tokens: int = 0):
+        """Wait until a request using ``tokens`` tokens may be sent."""
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_request_slot, self._next_token_slot)
+            self._next_request_slot = start + self.request_interval
+            self._next_token_slot = start + tokens * self.token_interval
+
+        delay = start - now
+        if delay > 0:
+            await asyncio.sleep(delay)
@@ -0,0 +1,21 @@
+"""
+Token usage reporting shared by the LLM clients.
+"""
+
+from typing import Any, Dict, Optional
+
+
+def usage_dict(usage: Any) -> Optional[Dict[str, int]]:
+    """Plain dict of the token counters of an API ``usage`` object.
+
+    Reads the three counters directly instead of serializing the whole
+    pydantic model, which is comparatively slow and rarely needed.
+    """
+    if usage is None:
+        return None
+
+    return {
+        "prompt_tokens": usage.prompt_tokens,
+        "completion_tokens": usage.completion_tokens,
+        "total_tokens": usage.total_tokens,
+    }
@@ -1,11 +1,18 @@
 import os
+import random
+import asyncio
+import contextlib
+import httpx
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import time
 import zipfile
 import tempfile
 import shutil
 from pathlib import Path
-from typing import Optional, Union, Dict, Any
+from typing import Optional, Union, Dict, Any, BinaryIO, List, AsyncIterator
 import logging
 
 # Configure logging
@@ -14,6 +21,22 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Status polls start about a second apart and back off by this factor, up to
+# MAX_POLL_INTERVAL seconds
+POLL_BACKOFF_FACTOR = 1.8
+MAX_POLL_INTERVAL = 30
+
+# Read size when streaming result archives
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Result archives up to this size are buffered in memory; larger ones spill
+# to a temporary file
+ZIP_SPOOL_MAX_SIZE = 128 * 1024 * 1024
+
+# Connection pool size of the sync session; status polls and downloads for
+# concurrent papers all go through it
+SESSION_POOL_SIZE = 20
+
 
 class MinerUClient:
     """Client for MinerU API to parse papers and extract markdown content."""
@@ -34,6 +57,42 @@ class MinerUClient:
             "Content-Type": "application/json",
             "Authorization": f"Bearer {self.api_key}",
         }
+        self.session = self._create_session()
+
+    @staticmethod
+    def _create_session() -> requests.Session:
+        """Build a keep-alive session that retries transient errors on reads.
+
+        Only GETs are retried: re-sending a POST could create a duplicate task,
+        and an upload body may already have been consumed. The API headers are
+        passed per request rather than set on the session, since presigned
+        upload URLs and the result CDN must not receive the API key.
+        """
+        retry = Retry(
+            total=5,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=frozenset({"GET", "HEAD"}),
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=10, pool_maxsize=SESSION_POOL_SIZE, max_retries=retry
+        )
+
+        session = requests.Session()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    def close(self):
+        """Close the underlying HTTP session and its pooled connections."""
+        self.session.close()
+
+    def __enter__(self) -> "MinerUClient":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
 
     def parse_from_url(self, url: str, output_dir: str = ".", **kwargs) -> str:
         """
@@ -63,7 +122,7 @@ class MinerUClient:
 
         # Download and extract results
         markdown_file = self._download_and_extract_results(
-            result["full_zip_url"], output_dir
+            result["full_zip_url"], os.path.join(output_dir, task_id)
         )
         logger.info(f"Successfully parsed paper. Output saved to: {markdown_file}")
 
@@ -82,19 +141,53 @@ class MinerUClient:
             Path to the output markdown file
         """
         logger.info(f"Starting to parse local file: {file_path}")
+        return self._parse_upload(file_path, Path(file_path).name, output_dir, **kwargs)
+
+    def parse_from_bytes(
+        self,
+        data: Union[bytes, BinaryIO],
+        file_name: str,
+        output_dir: str = ".",
+        **kwargs,
+    ) -> str:
+        """
+        Parse an in-memory PDF and save markdown output.
 
+        The bytes or file object are uploaded as-is, so callers holding the
+        document in memory (e.g. a web upload) need not write it to disk first.
+
+        Args:
+            data: File contents as bytes or a binary file object
+            file_name: Name of the file, used for the upload
+            output_dir: Directory to save the output markdown file
+            **kwargs: Additional parameters for parsing
+
+        Returns:
+            Path to the output markdown file
+        """
+        logger.info(f"Starting to parse uploaded file: {file_name}")
+        return self._parse_upload(data, file_name, output_dir, **kwargs)
+
+    def _parse_upload(
+        self,
+        source: Union[str, bytes, BinaryIO],
+        file_name: str,
+        output_dir: str = ".",
+        **kwargs,
+    ) -> str:
+        """Upload ``source`` under ``file_name``, wait for parsing and fetch results."""
         # Get upload URLs
-        batch_id, upload_urls = self._get_upload_urls([file_path], **kwargs)
+        batch_id, upload_urls = self._get_upload_urls([file_name], **kwargs)
         logger.info(f"Got upload URLs for batch ID: {batch_id}")
 
         # Upload file
-        self._upload_file(file_path, upload_urls[0])
+        self._upload_file(source, upload_urls[0])
         logger.info("File uploaded successfully")
 
         # Wait for parsing completion
         result = self._wait_for_batch_completion(
             batch_id,
-            Path(file_path).name,
+            Path(file_name).name,
             max_wait_time=kwargs.get("max_wait_time", 30),
         )
 
@@ -103,17 +196,187 @@ class MinerUClient:
 
         # Download and extract results
         markdown_file = self._download_and_extract_results(
-            result["full_zip_url"], output_dir
+            result["full_zip_url"], os.path.join(output_dir, batch_id)
         )
         logger.info(f"Successfully parsed file. Output saved to: {markdown_file}")
 
         return markdown_file
 
-    def _create_parsing_task(self, paper_url: str, **kwargs) -> str:
-        """Create a parsing task for a URL."""
-        endpoint = f"{self.base_url}/extract/task"
+    async def aparse_from_url(self, url: str, output_dir: str = ".", **kwargs) -> str:
+        """
+        Async variant of :meth:`parse_from_url`.
+
+        Polling is done with ``await asyncio.sleep`` so several papers can be
+        parsed concurrently on one event loop.
+        """
+        logger.info(f"Starting to parse paper from URL: {url}")
+        return await self._aparse_url(url, output_dir, **kwargs)
+
+    async def _aparse_url(
+        self,
+        url: str,
+        output_dir: str = ".",
+        client: Optional[httpx.AsyncClient] = None,
+        **kwargs,
+    ) -> str:
+        """Parse a URL, reusing ``client`` for the API calls when given."""
+        async with self._api_client(client) as client:
+            task_id = await self._acreate_parsing_task(client, url, **kwargs)
+            logger.info(f"Created parsing task with ID: {task_id}")
+
+            result = await self._await_task_completion(
+                client, task_id, max_wait_time=kwargs.get("max_wait_time", 30)
+            )
+
+        if result["state"] != "done":
+            raise Exception(f"Parsing failed: {result.get('err_msg', 'Unknown error')}")
 
-        data = {
+        markdown_file = await self._adownload_and_extract_results(
+            result["full_zip_url"],
+            os.path.join(output_dir, task_id),
+        )
+        logger.info(f"Successfully parsed paper. Output saved to: {markdown_file}")
+
+        return markdown_file
+
+    async def aparse_from_file(
+        self, file_path: str, output_dir: str = ".", **kwargs
+    ) -> str:
+        """
+        Async variant of :meth:`parse_from_file`.
+        """
+        logger.info(f"Starting to parse local file: {file_path}")
+        return await self._aparse_upload(
+            file_path, Path(file_path).name, output_dir, **kwargs
+        )
+
+    async def aparse_from_bytes(
+        self,
+        data: Union[bytes, BinaryIO],
+        file_name: str,
+        output_dir: str = ".",
+        **kwargs,
+    ) -> str:
+        """
+        Async variant of :meth:`parse_from_bytes`.
+        """
+        logger.info(f"Starting to parse uploaded file: {file_name}")
+        return await self._aparse_upload(data, file_name, output_dir, **kwargs)
+
+    async def _aparse_upload(
+        self,
+        source: Union[str, bytes, BinaryIO],
+        file_name: str,
+        output_dir: str = ".",
+        client: Optional[httpx.AsyncClient] = None,
+        **kwargs,
+    ) -> str:
+        """Async variant of :meth:`_parse_upload`."""
+        async with self._api_client(client) as client:
+            batch_id, upload_urls = await self._aget_upload_urls(
+                client, [file_name], **kwargs
+            )
+            logger.info(f"Got upload URLs for batch ID: {batch_id}")
+
+            await asyncio.to_thread(self._upload_file, source, upload_urls[0])
+            logger.info("File uploaded successfully")
+
+            result = await self._await_batch_completion(
+                client,
+                batch_id,
+                Path(file_name).name,
+                max_wait_time=kwargs.get("max_wait_time", 30),
+            )
+
+        if result["state"] != "done":
+            raise Exception(f"Parsing failed: {result.get('err_msg', 'Unknown error')}")
+
+        markdown_file = await self._adownload_and_extract_results(
+            result["full_zip_url"],
+            os.path.join(output_dir, batch_id),
+        )
+        logger.info(f"Successfully parsed file. Output saved to: {markdown_file}")
+
+        return markdown_file
+
+    async def aparse_many(
+        self,
+        inputs: List[str],
+        output_dir: str = ".",
+        max_concurrency: int = 8,
+        **kwargs,
+    ) -> List[Union[str, Exception]]:
+        """
+        Parse several URLs and/or local files concurrently.
+
+        All tasks share one HTTP connection pool and wait on the same event
+        loop, so total wall time is close to that of the slowest paper rather
+        than the sum.
+
+        Args:
+            inputs: Paper URLs or local file paths
+            output_dir: Directory to save the parsed markdown files
+            max_concurrency: Maximum number of papers in flight at once
+            **kwargs: Parsing options, as for :meth:`parse_from_url`
+
+        Returns:
+            For each input, in order, the markdown file path or the exception
+            that made it fail
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def parse(client: httpx.AsyncClient, source: str) -> str:
+            async with semaphore:
+                if source.startswith(("http://", "https://")):
+                    logger.info(f"Starting to parse paper from URL: {source}")
+                    return await self._aparse_url(
+                        source, output_dir, client=client, **kwargs
+                    )
+
+                logger.info(f"Starting to parse local file: {source}")
+                return await self._aparse_upload(
+                    source, Path(source).name, output_dir, client=client, **kwargs
+                )
+
+        async with self._api_client() as client:
+            return await asyncio.gather(
+                *(parse(client, source) for source in inputs), return_exceptions=True
+            )
+
+    def parse_many(
+        self,
+        inputs: List[str],
+        output_dir: str = ".",
+        max_concurrency: int = 8,
+        **kwargs,
+    ) -> List[Union[str, Exception]]:
+        """
+        Blocking wrapper around :meth:`aparse_many`.
+        """
+        # Imported here so the module still runs as a standalone script
+        from src.utils.async_utils import run_sync
+
+        return run_sync(
+            self.aparse_many(
+                inputs, output_dir, max_concurrency=max_concurrency, **kwargs
+            )
+        )
+
+    @contextlib.asynccontextmanager
+    async def _api_client(
+        self, client: Optional[httpx.AsyncClient] = None
+    ) -> AsyncIterator[httpx.AsyncClient]:
+        """Yield ``client`` if given, else a new authenticated async client."""
+        if client is not None:
+            yield client
+            return
+
+        async with httpx.AsyncClient(headers=self.headers) as new_client:
+            yield new_client
+
+    def _task_payload(self, paper_url: str, **kwargs) -> Dict[str, Any]:
+        """Build the request body for a URL parsing task."""
+        return {
             # The URL of the paper to be parsed (must be the original input URL)
             "url": paper_url,
             "is_ocr": kwargs.get("is_ocr", True),
@@ -123,19 +386,8 @@ class MinerUClient:
             "model_version": kwargs.get("model_version", "v2"),
         }
 
-        response = requests.post(endpoint, headers=self.headers, json=data)
-        response.raise_for_status()
-
-        result = response.json()
-        if result["code"] != 0:
-            raise Exception(f"Failed to create parsing task: {result['msg']}")
-
-        return result["data"]["task_id"]
-
-    def _get_upload_urls(self, file_paths: list, **kwargs) -> tuple:
-        """Get upload URLs for local files."""
-        url = f"{self.base_url}/file-urls/batch"
-
+    def _batch_payload(self, file_paths: list, **kwargs) -> Dict[str, Any]:
+        """Build the request body for a local file upload batch."""
         files = []
         for file_path in file_paths:
             files.append(
@@ -146,7 +398,7 @@ class MinerUClient:
                 }
             )
 
-        data = {
+        return {
             "enable_formula": kwargs.get("enable_formula", True),
             "enable_table": kwargs.get("enable_table", True),
             "language": kwargs.get("language", "auto"),
@@ -154,45 +406,214 @@ class MinerUClient:
             "files": files,
         }
 
-        response = requests.post(url, headers=self.headers, json=data)
+    @staticmethod
+    def _unwrap(result: Dict[str, Any], action: str) -> Dict[str, Any]:
+        """Return the ``data`` field of an API response or raise on error."""
+        if result["code"] != 0:
+            raise Exception(f"Failed to {action}: {result['msg']}")
+
+        return result["data"]
+
+    def _create_parsing_task(self, paper_url: str, **kwargs) -> str:
+        """Create a parsing task for a URL."""
+        endpoint = f"{self.base_url}/extract/task"
+
+        data = self._task_payload(paper_url, **kwargs)
+
+        response = self.session.post(endpoint, headers=self.headers, json=data)
         response.raise_for_status()
 
-        result = response.json()
-        if result["code"] != 0:
-            raise Exception(f"Failed to get upload URLs: {result['msg']}")
+        return self._unwrap(orjson.loads(response.content), "create parsing task")["task_id"]
+
+    async def _acreate_parsing_task(
+        self, client: httpx.AsyncClient, paper_url: str, **kwargs
+    ) -> str:
+        """Async variant of :meth:`_create_parsing_task`."""
+        endpoint = f"{self.base_url}/extract/task"
+
+        response = await client.post(
+            endpoint, json=self._task_payload(paper_url, **kwargs)
+        )
+        response.raise_for_status()
+
+        return self._unwrap(orjson.loads(response.content), "create parsing task")["task_id"]
 
-        return result["data"]["batch_id"], result["data"]["file_urls"]
+    def _get_upload_urls(self, file_paths: list, **kwargs) -> tuple:
+        """Get upload URLs for local files."""
+        url = f"{self.base_url}/file-urls/batch"
 
-    def _upload_file(self, file_path: str, upload_url: str):
-        """Upload a file to the provided upload URL."""
-        with open(file_path, "rb") as f:
-            response = requests.put(upload_url, data=f)
-            response.raise_for_status()
+        data = self._batch_payload(file_paths, **kwargs)
+
+        response = self.session.post(url, headers=self.headers, json=data)
+        response.raise_for_status()
+
+        result = self._unwrap(orjson.loads(response.content), "get upload URLs")
+        return result["batch_id"], result["file_urls"]
+
+    async def _aget_upload_urls(
+        self, client: httpx.AsyncClient, file_paths: list, **kwargs
+    ) -> tuple:
+        """Async variant of :meth:`_get_upload_urls`."""
+        url = f"{self.base_url}/file-urls/batch"
+
+        response = await client.post(url, json=self._batch_payload(file_paths, **kwargs))
+        response.raise_for_status()
+
+        result = self._unwrap(orjson.loads(response.content), "get upload URLs")
+        return result["batch_id"], result["file_urls"]
+
+    def _upload_file(self, source: Union[str, bytes, BinaryIO], upload_url: str):
+        """Upload a file path, bytes or binary file object to the upload URL."""
+        if isinstance(source, (str, os.PathLike)):
+            with open(source, "rb") as f:
+                response = self.session.put(upload_url, data=f)
+        else:
+            if hasattr(source, "seek"):
+                # The caller may already have read the buffer (e.g. to hash it)
+                source.seek(0)
+            response = self.session.put(upload_url, data=source)
+        response.raise_for_status()
+
+    def _check_task_result(
+        self, label: str, result: Dict[str, Any]
+    ) -> Optional[Dict[str, Any]]:
+        """Return a finished task result, raise on failure, log progress otherwise."""
+        if result["state"] == "done":
+            return result
+        elif result["state"] == "failed":
+            raise Exception(f"Task failed: {result.get('err_msg', 'Unknown error')}")
+
+        logger.info(f"{label} status: {result['state']}")
+        if result["state"] == "running" and "extract_progress" in result:
+            progress = result["extract_progress"]
+            logger.info(
+                f"Progress: {progress['extracted_pages']}/{progress['total_pages']} pages"
+            )
+
+        return None
+
+    @staticmethod
+    def _find_file_result(
+        result: Dict[str, Any], file_name: str
+    ) -> Optional[Dict[str, Any]]:
+        """Return the entry for ``file_name`` in a batch status response."""
+        for file_result in result["extract_result"]:
+            if file_result["file_name"] == file_name:
+                return file_result
+
+        return None
+
+    def _check_batch_result(
+        self, file_result: Optional[Dict[str, Any]], file_name: str
+    ) -> Optional[Dict[str, Any]]:
+        """Check the state of a file's entry in a batch status response."""
+        if file_result is None:
+            return None
+
+        return self._check_task_result(f"File {file_name}", file_result)
+
+    @staticmethod
+    def _estimate_remaining(
+        status: Optional[Dict[str, Any]], start_time: float
+    ) -> Optional[float]:
+        """Estimate the seconds left from the page progress of a running task."""
+        progress = (status or {}).get("extract_progress") or {}
+        extracted = progress.get("extracted_pages") or 0
+        total = progress.get("total_pages") or 0
+        elapsed = time.time() - start_time
+        if extracted <= 0 or total <= extracted or elapsed <= 0:
+            return None
+
+        return (total - extracted) * elapsed / extracted
+
+    @classmethod
+    def _poll_interval(
+        cls,
+        attempt: int,
+        start_time: float,
+        max_wait_time: int,
+        status: Optional[Dict[str, Any]] = None,
+    ) -> float:
+        """Delay before the next status poll, never sleeping past the deadline.
+
+        Backs off exponentially (with jitter) from about one second. Once the
+        task reports page progress, waits half the estimated remaining time
+        instead, so long parses are polled rarely and short ones promptly.
+        """
+        remaining_estimate = cls._estimate_remaining(status, start_time)
+        if remaining_estimate is not None:
+            interval = min(MAX_POLL_INTERVAL, max(1.0, remaining_estimate / 2))
+        else:
+            interval = min(MAX_POLL_INTERVAL, POLL_BACKOFF_FACTOR ** min(attempt, 8))
+        interval += random.uniform(0, 0.5)
+
+        remaining = max_wait_time - (time.time() - start_time)
+        return max(0.0, min(interval, remaining))
+
+    @staticmethod
+    def _retry_after(response: httpx.Response) -> float:
+        """Seconds to wait before retrying a rate-limited request."""
+        try:
+            delay = float(response.headers.get("Retry-After", 1))
+        except ValueError:
+            # HTTP-date values are rare for this API; fall back to a short pause
+            delay = 1.0
+        return min(MAX_POLL_INTERVAL, max(0.0, delay))
+
+    async def _aget_json(
+        self, client: httpx.AsyncClient, url: str, action: str
+    ) -> Dict[str, Any]:
+        """GET an API endpoint, waiting out 429 responses per ``Retry-After``.
+
+        The sync session gets this from its urllib3 retry policy.
+        """
+        response = await client.get(url)
+        for _ in range(5):
+            if response.status_code != 429:
+                break
+            await asyncio.sleep(self._retry_after(response))
+            response = await client.get(url)
+        response.raise_for_status()
+
+        return self._unwrap(orjson.loads(response.content), action)
 
     def _wait_for_task_completion(
         self, task_id: str, max_wait_time: int = 30
     ) -> Dict[str, Any]:
         """Wait for a single task to complete."""
         start_time = time.time()
+        attempt = 0
 
         while time.time() - start_time < max_wait_time:
-            result = self._get_task_status(task_id)
-
-            if result["state"] == "done":
+            status = self._get_task_status(task_id)
+            result = self._check_task_result(f"Task {task_id}", status)
+            if result is not None:
                 return result
-            elif result["state"] == "failed":
-                raise Exception(
-                    f"Task failed: {result.get('err_msg', 'Unknown error')}"
-                )
 
-            logger.info(f"Task {task_id} status: {result['state']}")
-            if result["state"] == "running" and "extract_progress" in result:
-                progress = result["extract_progress"]
-                logger.info(
-                    f"Progress: {progress['extracted_pages']}/{progress['total_pages']} pages"
-                )
+            time.sleep(self._poll_interval(attempt, start_time, max_wait_time, status))
+            attempt += 1
 
-            time.sleep(10)  # Wait 10 seconds before checking again
+        raise TimeoutError(
+            f"Task {task_id} did not complete within {max_wait_time} seconds"
+        )
+
+    async def _await_task_completion(
+        self, client: httpx.AsyncClient, task_id: str, max_wait_time: int = 30
+    ) -> Dict[str, Any]:
+        """Async variant of :meth:`_wait_for_task_completion`."""
+        start_time = time.time()
+        attempt = 0
+
+        while time.time() - start_time < max_wait_time:
+            status = await self._aget_task_status(client, task_id)
+            result = self._check_task_result(f"Task {task_id}", status)
+            if result is not None:
+                return result
+
+            await asyncio.sleep(
+                self._poll_interval(attempt, start_time, max_wait_time, status)
+            )
+            attempt += 1
 
         raise TimeoutError(
             f"Task {task_id} did not complete within {max_wait_time} seconds"
@@ -203,32 +624,44 @@ class MinerUClient:
     ) -> Dict[str, Any]:
         """Wait for a batch task to complete."""
         start_time = time.time()
+        attempt = 0
 
         while time.time() - start_time < max_wait_time:
-            result = self._get_batch_status(batch_id)
-
-            # Find the specific file result
-            for file_result in result["extract_result"]:
-                if file_result["file_name"] == file_name:
-                    if file_result["state"] == "done":
-                        return file_result
-                    elif file_result["state"] == "failed":
-                        raise Exception(
-                            f"Task failed: {file_result.get('err_msg', 'Unknown error')}"
-                        )
-
-                    logger.info(f"File {file_name} status: {file_result['state']}")
-                    if (
-                        file_result["state"] == "running"
-                        and "extract_progress" in file_result
-                    ):
-                        progress = file_result["extract_progress"]
-                        logger.info(
-                            f"Progress: {progress['extracted_pages']}/{progress['total_pages']} pages"
-                        )
-                    break
-
-            time.sleep(10)  # Wait 10 seconds before checking again
+            status = self._find_file_result(self._get_batch_status(batch_id), file_name)
+            result = self._check_batch_result(status, file_name)
+            if result is not None:
+                return result
+
+            time.sleep(self._poll_interval(attempt, start_time, max_wait_time, status))
+            attempt += 1
+
+        raise TimeoutError(
+            f"Batch task {batch_id} did not complete within {max_wait_time} seconds"
+        )
+
+    async def _await_batch_completion(
+        self,
+        client: httpx.AsyncClient,
+        batch_id: str,
+        file_name: str,
+        max_wait_time: int = 30,
+    ) -> Dict[str, Any]:
+        """Async variant of :meth:`_wait_for_batch_completion`."""
+        start_time = time.time()
+        attempt = 0
+
+        while time.time() - start_time < max_wait_time:
+            status = self._find_file_result(
+                await self._aget_batch_status(client, batch_id), file_name
+            )
+            result = self._check_batch_result(status, file_name)
+            if result is not None:
+                return result
+
+            await asyncio.sleep(
+                self._poll_interval(attempt, start_time, max_wait_time, status)
+            )
+            attempt += 1
 
         raise TimeoutError(
             f"Batch task {batch_id} did not complete within {max_wait_time} seconds"
@@ -237,60 +670,109 @@ class MinerUClient:
     def _get_task_status(self, task_id: str) -> Dict[str, Any]:
         """Get the status of a single task."""
         url = f"{self.base_url}/extract/task/{task_id}"
-        response = requests.get(url, headers=self.headers)
+        response = self.session.get(url, headers=self.headers)
         response.raise_for_status()
 
-        result = response.json()
-        if result["code"] != 0:
-            raise Exception(f"Failed to get task status: {result['msg']}")
+        return self._unwrap(orjson.loads(response.content), "get task status")
 
-        return result["data"]
+    async def _aget_task_status(
+        self, client: httpx.AsyncClient, task_id: str
+    ) -> Dict[str, Any]:
+        """Async variant of :meth:`_get_task_status`."""
+        return await self._aget_json(
+            client, f"{self.base_url}/extract/task/{task_id}", "get task status"
+        )
 
     def _get_batch_status(self, batch_id: str) -> Dict[str, Any]:
         """Get the status of a batch task."""
         url = f"{self.base_url}/extract-results/batch/{batch_id}"
-        response = requests.get(url, headers=self.headers)
+        response = self.session.get(url, headers=self.headers)
         response.raise_for_status()
 
-        result = response.json()
-        if result["code"] != 0:
-            raise Exception(f"Failed to get batch status: {result['msg']}")
+        return self._unwrap(orjson.loads(response.content), "get batch status")
 
-        return result["data"]
+    async def _aget_batch_status(
+        self, client: httpx.AsyncClient, batch_id: str
+    ) -> Dict[str, Any]:
+        """Async variant of :meth:`_get_batch_status`."""
+        return await self._aget_json(
+            client,
+            f"{self.base_url}/extract-results/batch/{batch_id}",
+            "get batch status",
+        )
 
     def _download_and_extract_results(self, zip_url: str, output_dir: str) -> str:
         """Download and extract the results ZIP file."""
-        # Create output directory
-        Path(output_dir).mkdir(parents=True, exist_ok=True)
+        logger.info("Downloading results...")
+        return self._extract_results(self._download_zip(zip_url), output_dir)
 
-        # Download ZIP file
+    async def _adownload_and_extract_results(self, zip_url: str, output_dir: str) -> str:
+        """Async variant of :meth:`_download_and_extract_results`."""
         logger.info("Downloading results...")
-        response = requests.get(zip_url, stream=True)
-        response.raise_for_status()
+        zip_file = await self._adownload_zip(zip_url)
+        return await asyncio.to_thread(self._extract_results, zip_file, output_dir)
 
-        # Save ZIP file temporarily
-        with tempfile.NamedTemporaryFile(suffix=".zip", delete=False) as temp_zip:
-            for chunk in response.iter_content(chunk_size=8192):
-                temp_zip.write(chunk)
-            temp_zip_path = temp_zip.name
+    def _download_zip(self, zip_url: str) -> BinaryIO:
+        """Stream the results ZIP into a spooled buffer and return it rewound."""
+        zip_file = tempfile.SpooledTemporaryFile(max_size=ZIP_SPOOL_MAX_SIZE)
+        try:
+            with self.session.get(zip_url, stream=True) as response:
+                response.raise_for_status()
+                for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                    zip_file.write(chunk)
+        except BaseException:
+            zip_file.close()
+            raise
+
+        zip_file.seek(0)
+        return zip_file
+
+    async def _adownload_zip(self, zip_url: str) -> BinaryIO:
+        """Async variant of :meth:`_download_zip`."""
+        zip_file = tempfile.SpooledTemporaryFile(max_size=ZIP_SPOOL_MAX_SIZE)
+        try:
+            # The archive is served from a CDN, so don't send the API headers
+            async with httpx.AsyncClient(follow_redirects=True) as client:
+                async with client.stream("GET", zip_url) as response:
+                    response.raise_for_status()
+                    async for chunk in response.aiter_bytes(DOWNLOAD_CHUNK_SIZE):
+                        zip_file.write(chunk)
+        except BaseException:
+            zip_file.close()
+            raise
+
+        zip_file.seek(0)
+        return zip_file
+
+    def _extract_results(self, zip_file: BinaryIO, output_dir: str) -> str:
+        """Extract a downloaded results ZIP and return the markdown file path."""
+        # Create output directory
+        Path(output_dir).mkdir(parents=True, exist_ok=True)
 
         try:
             # Extract ZIP file
             logger.info("Extracting results...")
-            with zipfile.ZipFile(temp_zip_path, "r") as zip_ref:
+            with zipfile.ZipFile(zip_file, "r") as zip_ref:
                 zip_ref.extractall(output_dir)
+                # Take the markdown name from the archive listing rather than
+                # scanning the output directory after extraction
+                markdown_name = next(
+                    (
+                        name
+                        for name in zip_ref.namelist()
+                        if name.endswith(".md") and "/" not in name
+                    ),
+                    None,
+                )
 
-            # Find markdown file
-            markdown_files = list(Path(output_dir).glob("*.md"))
-            if not markdown_files:
+            if markdown_name is None:
                 raise FileNotFoundError("No markdown file found in extracted results")
 
-            # Return the first markdown file found
-            return str(markdown_files[0])
+            return str(Path(output_dir) / markdown_name)
 
         finally:
-            # Clean up temporary ZIP file
-            os.unlink(temp_zip_path)
+            # Release the buffer (and its spill file, if any)
+            zip_file.close()
 
 
 def main():
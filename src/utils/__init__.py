@@ -0,0 +1,3 @@
+from .async_utils import run_sync
+
+__all__ = ["run_sync"]
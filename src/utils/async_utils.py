@@ -0,0 +1,22 @@
+"""
+Helpers for calling coroutines from the synchronous APIs.
+"""
+
+import asyncio
+import concurrent.futures
+
+
+def run_sync(coro):
+    """Run ``coro`` to completion from sync code.
+
+    ``asyncio.run`` refuses to start inside a running event loop (Jupyter,
+    async web handlers), so there the coroutine gets its own loop in a
+    worker thread instead.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coro).result()
@@ -0,0 +1,141 @@
+import io
+import tempfile
+import unittest
+from pathlib import Path
+
+from pipelines.cache import ReviewCache, ParseCache
+from pipelines.config import LLMConfig
+
+from tests.utils import make_pipeline
+
+
+class ReviewCacheTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.cache_dir = self._tmp.name
+
+    def open_cache(self, **kwargs) -> ReviewCache:
+        cache = ReviewCache(self.cache_dir, **kwargs)
+        self.addCleanup(cache.close)
+        return cache
+
+    def test_hit_and_miss(self):
+        cache = self.open_cache()
+        self.assertIsNone(cache.get("missing"))
+
+        cache.set("key", '{"score": 7}')
+
+        self.assertEqual(cache.get("key"), '{"score": 7}')
+
+    def test_entries_persist_across_instances(self):
+        self.open_cache().set("key", '{"score": 7}')
+
+        self.assertEqual(self.open_cache().get("key"), '{"score": 7}')
+
+    def test_memory_eviction_falls_back_to_sqlite(self):
+        cache = self.open_cache(memory_size=2)
+        for i in range(3):
+            cache.set(f"key-{i}", str(i))
+
+        self.assertEqual(list(cache._memory), ["key-1", "key-2"])
+        self.assertEqual(cache.get("key-0"), "0")
+        self.assertEqual(list(cache._memory), ["key-2", "key-0"])
+
+    def test_get_refreshes_lru_order(self):
+        cache = self.open_cache(memory_size=2)
+        cache.set("a", "1")
+        cache.set("b", "2")
+
+        cache.get("a")
+        cache.set("c", "3")
+
+        self.assertEqual(list(cache._memory), ["a", "c"])
+
+    def test_make_key_depends_on_prompt_and_params(self):
+        key = ReviewCache.make_key("prompt", model="qwen-plus", temperature=0.1)
+
+        self.assertEqual(
+            key, ReviewCache.make_key("prompt", temperature=0.1, model="qwen-plus")
+        )
+        self.assertNotEqual(
+            key, ReviewCache.make_key("other", model="qwen-plus", temperature=0.1)
+        )
+        self.assertNotEqual(
+            key, ReviewCache.make_key("prompt", model="qwen-max", temperature=0.1)
+        )
+
+
+class ReviewCacheKeyTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+
+    def key(self, llm: LLMConfig, **kwargs):
+        pipeline = make_pipeline(
+            self._tmp.name, llm=llm, review_cache_max_temperature=0.3
+        )
+        self.addCleanup(pipeline.review_cache.close)
+        return pipeline._review_cache_key("prompt", "neurips", **kwargs)
+
+    def test_key_changes_with_model_temperature_and_kwargs(self):
+        base = self.key(LLMConfig(api_key="test-key"))
+
+        self.assertEqual(base, self.key(LLMConfig(api_key="test-key")))
+        self.assertNotEqual(
+            base, self.key(LLMConfig(api_key="test-key", model_name="qwen-max"))
+        )
+        self.assertNotEqual(
+            base, self.key(LLMConfig(api_key="test-key", temperature=0.0))
+        )
+        self.assertNotEqual(base, self.key(LLMConfig(api_key="test-key"), top_p=0.5))
+
+    def test_no_key_above_temperature_threshold(self):
+        self.assertIsNone(self.key(LLMConfig(api_key="test-key", temperature=0.7)))
+        self.assertIsNone(self.key(LLMConfig(api_key="test-key"), temperature=0.9))
+        self.assertIsNotNone(self.key(LLMConfig(api_key="test-key", temperature=0.3)))
+
+
+class ParseCacheTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.tmp = Path(self._tmp.name)
+        self.cache = ParseCache(self.tmp)
+
+    def test_file_and_file_object_fingerprints_match(self):
+        data = b"%PDF-1.7 " + bytes(range(256)) * 5000
+        path = self.tmp / "paper.pdf"
+        path.write_bytes(data)
+        upload = io.BytesIO(data)
+
+        self.assertEqual(
+            ParseCache.fingerprint(str(path)), ParseCache.fingerprint(upload)
+        )
+        self.assertEqual(upload.tell(), 0)
+        self.assertNotEqual(
+            ParseCache.fingerprint(str(path)), ParseCache.fingerprint(io.BytesIO(b"x"))
+        )
+
+    def test_key_depends_on_parsing_options(self):
+        fingerprint = ParseCache.fingerprint(io.BytesIO(b"paper"))
+
+        self.assertNotEqual(
+            ParseCache.make_key(fingerprint, {"is_ocr": True}),
+            ParseCache.make_key(fingerprint, {"is_ocr": False}),
+        )
+
+    def test_hit_and_miss(self):
+        output_file = self.tmp / "full.md"
+        output_file.write_text("# Paper")
+        key = ParseCache.make_key("fingerprint", {"is_ocr": True})
+        self.assertIsNone(self.cache.get(key))
+
+        self.cache.put(key, str(output_file), "paper.pdf", {"is_ocr": True})
+
+        self.assertEqual(Path(self.cache.get(key)).read_text(), "# Paper")
+        self.assertEqual(list(self.cache.cache_dir.glob("*.tmp")), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
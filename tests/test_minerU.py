@@ -0,0 +1,86 @@
+import io
+import asyncio
+import zipfile
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.minerU.minerU import MinerUClient
+
+
+def _zip_with_markdown(text: str) -> io.BytesIO:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as zip_ref:
+        zip_ref.writestr("full.md", text)
+    buffer.seek(0)
+    return buffer
+
+
+class FakeUploadClient(MinerUClient):
+    """MinerUClient whose API calls are answered locally.
+
+    Each upload gets its own batch ID, and the result archive holds the
+    uploaded file's contents as ``full.md``.
+    """
+
+    def __init__(self):
+        super().__init__(api_key="test-key")
+        self._batches = {}
+
+    async def _aget_upload_urls(self, client, file_paths, **kwargs):
+        batch_id = f"batch-{len(self._batches)}"
+        self._batches[batch_id] = None
+        return batch_id, [batch_id]
+
+    def _upload_file(self, source, upload_url):
+        self._batches[upload_url] = Path(source).read_text()
+
+    async def _await_batch_completion(self, client, batch_id, file_name, **kwargs):
+        return {"state": "done", "full_zip_url": batch_id}
+
+    async def _adownload_zip(self, zip_url):
+        return _zip_with_markdown(self._batches[zip_url])
+
+
+class ParseManyTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.tmp = Path(self._tmp.name)
+        self.client = FakeUploadClient()
+        self.addCleanup(self.client.close)
+        self.addCleanup(self._tmp.cleanup)
+
+    def _write_papers(self):
+        paths = []
+        for folder in ("a", "b"):
+            path = self.tmp / folder / "paper.pdf"
+            path.parent.mkdir()
+            path.write_text(f"paper from {folder}")
+            paths.append(str(path))
+        return paths
+
+    def test_same_file_name_in_different_directories(self):
+        paths = self._write_papers()
+
+        outputs = self.client.parse_many(paths, output_dir=str(self.tmp / "out"))
+
+        self.assertEqual(len(set(outputs)), 2)
+        self.assertEqual(Path(outputs[0]).read_text(), "paper from a")
+        self.assertEqual(Path(outputs[1]).read_text(), "paper from b")
+
+    def test_parse_many_inside_running_event_loop(self):
+        paths = self._write_papers()
+
+        async def main():
+            return self.client.parse_many(paths, output_dir=str(self.tmp / "out"))
+
+        outputs = asyncio.run(main())
+
+        self.assertEqual(
+            [Path(output).read_text() for output in outputs],
+            ["paper from a", "paper from b"],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
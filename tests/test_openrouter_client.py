@@ -0,0 +1,89 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from openai.types.chat import ChatCompletion
+
+from src.llms.openrouter_client import OpenRouterClient, OpenRouterConfig
+
+MESSAGES = [{"role": "user", "content": "Score this paper"}]
+
+
+def _completion(content: str) -> ChatCompletion:
+    return ChatCompletion.construct(
+        id="gen-1",
+        object="chat.completion",
+        created=1,
+        model="test/model",
+        choices=[
+            {
+                "index": 0,
+                "finish_reason": "stop",
+                "message": {"role": "assistant", "content": content},
+            }
+        ],
+        usage={"prompt_tokens": 3, "completion_tokens": 2, "total_tokens": 5},
+    )
+
+
+class DiskCacheTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.cache_dir = Path(self._tmp.name)
+        self.calls = 0
+
+    def _client(self) -> OpenRouterClient:
+        config = OpenRouterConfig(
+            api_key="test-key",
+            temperature=0.0,
+            response_cache_size=0,
+            disk_cache_enabled=True,
+            disk_cache_dir=str(self.cache_dir),
+        )
+        client = OpenRouterClient(config=config)
+
+        def create(**kwargs):
+            self.calls += 1
+            return _completion('{"score": 7}')
+
+        client.client.chat.completions.create = create
+        return client
+
+    def test_disk_hit_matches_live_result(self):
+        live = self._client().chat_completion(MESSAGES)
+        cached = self._client().chat_completion(MESSAGES)
+
+        self.assertEqual(self.calls, 1)
+        self.assertEqual(cached.keys(), live.keys())
+        self.assertEqual(cached["content"], live["content"])
+        self.assertEqual(cached["usage"], live["usage"])
+        self.assertIsInstance(cached["response"], ChatCompletion)
+        self.assertEqual(cached["response"].to_dict(), live["response"].to_dict())
+
+    def test_corrupt_entry_is_a_miss(self):
+        self._client().chat_completion(MESSAGES)
+        for entry in ("[]", "{}", '{"created_at": "yesterday"}'):
+            for path in self.cache_dir.glob("*.json"):
+                path.write_text(entry)
+
+            result = self._client().chat_completion(MESSAGES)
+
+            self.assertTrue(result["success"])
+        self.assertEqual(self.calls, 4)
+
+    def test_unserializable_entry_is_skipped(self):
+        result = {
+            "success": True,
+            "response": _completion("{}"),
+            "content": "{}",
+            "usage": {"total_tokens": object()},
+        }
+
+        self._client()._write_disk_cache("key", result)
+
+        self.assertEqual(list(self.cache_dir.iterdir()), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
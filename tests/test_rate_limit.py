@@ -0,0 +1,72 @@
+import asyncio
+import unittest
+from unittest import mock
+
+from src.llms.rate_limit import AsyncRateLimiter
+
+
+class AsyncRateLimiterTest(unittest.TestCase):
+    """The clock is frozen, so each delay is exactly the reserved slot offset."""
+
+    def setUp(self):
+        self.sleeps = []
+
+        async def sleep(delay):
+            self.sleeps.append(round(delay, 6))
+
+        patches = [
+            mock.patch("src.llms.rate_limit.time.monotonic", return_value=1000.0),
+            mock.patch("src.llms.rate_limit.asyncio.sleep", sleep),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    def acquire_all(self, limiter: AsyncRateLimiter, *tokens: int):
+        async def run():
+            for count in tokens:
+                await limiter.acquire(count)
+
+        asyncio.run(run())
+
+    def test_requests_are_spaced_by_rpm(self):
+        limiter = AsyncRateLimiter(requests_per_minute=60)
+
+        self.acquire_all(limiter, 0, 0, 0)
+
+        # The first request goes out immediately
+        self.assertEqual(self.sleeps, [1.0, 2.0])
+
+    def test_requests_are_spaced_by_token_budget(self):
+        limiter = AsyncRateLimiter(tokens_per_minute=600)
+
+        self.acquire_all(limiter, 100, 50, 1)
+
+        # 600 tokens/min is 0.1s per token used by the requests before
+        self.assertEqual(self.sleeps, [10.0, 15.0])
+
+    def test_request_larger_than_token_budget(self):
+        limiter = AsyncRateLimiter(tokens_per_minute=1000)
+
+        self.acquire_all(limiter, 5000, 10)
+
+        # The oversized request is sent rather than blocking forever; the
+        # next one waits until its 5 minutes of budget are paid back
+        self.assertEqual(self.sleeps, [300.0])
+
+    def test_stricter_limit_wins(self):
+        limiter = AsyncRateLimiter(requests_per_minute=60, tokens_per_minute=6000)
+
+        self.acquire_all(limiter, 10, 500, 10)
+
+        self.assertEqual(self.sleeps, [1.0, 6.0])
+
+    def test_requires_a_limit(self):
+        with self.assertRaises(ValueError):
+            AsyncRateLimiter()
+        with self.assertRaises(ValueError):
+            AsyncRateLimiter(requests_per_minute=-1)
+
+
+if __name__ == "__main__":
+    unittest.main()
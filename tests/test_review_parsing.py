@@ -0,0 +1,73 @@
+import tempfile
+import unittest
+
+from pipelines import ReviewParseError
+
+from tests.utils import make_pipeline
+
+PARSED = {"content": "A paper about caching."}
+
+
+class ParseReviewResponseTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.pipeline = make_pipeline(self._tmp.name)
+        self.addCleanup(self.pipeline.review_cache.close)
+
+    def score(self, response: str) -> int:
+        return self.pipeline._parse_review_response(response, "neurips")["score"]
+
+    def test_json_object(self):
+        self.assertEqual(self.score('{"score": 7}'), 7)
+        self.assertEqual(self.score(' {"score": 10}\n'), 10)
+
+    def test_regex_fallback(self):
+        self.assertEqual(self.score('```json\n{"score": 8}\n```'), 8)
+        self.assertEqual(self.score("I would rate this paper a 6 out of 10."), 6)
+        self.assertEqual(self.score("Score: 3"), 3)
+
+    def test_out_of_range_score_raises(self):
+        for response in ('{"score": 0}', '{"score": 42}', "11", "Score: 42"):
+            with self.subTest(response=response):
+                with self.assertRaises(ReviewParseError):
+                    self.score(response)
+
+    def test_missing_score_raises(self):
+        for response in ("", "Looks good to me.", '{"verdict": "accept"}', '{"score": "high"}'):
+            with self.subTest(response=response):
+                with self.assertRaises(ReviewParseError):
+                    self.score(response)
+
+
+class UnparseableResponseCacheTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.pipeline = make_pipeline(self._tmp.name)
+        self.addCleanup(self.pipeline.review_cache.close)
+
+    def cache_key(self) -> str:
+        prompt = self.pipeline._prepare_review_prompt(PARSED, "neurips")
+        return self.pipeline._review_cache_key(prompt, "neurips")
+
+    def test_unparseable_response_is_not_cached(self):
+        self.pipeline.llm_client.generate = lambda prompt, **kwargs: "No idea."
+
+        with self.assertRaises(ReviewParseError):
+            self.pipeline._generate_review(PARSED, "neurips")
+
+        self.assertIsNotNone(self.cache_key())
+        self.assertIsNone(self.pipeline.review_cache.get(self.cache_key()))
+
+    def test_parsed_response_is_cached(self):
+        self.pipeline.llm_client.generate = lambda prompt, **kwargs: '{"score": 5}'
+
+        review = self.pipeline._generate_review(PARSED, "neurips")
+
+        self.assertEqual(review["parsed_review"], {"score": 5})
+        self.assertEqual(self.pipeline.review_cache.get(self.cache_key()), '{"score": 5}')
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,92 @@
+import tempfile
+import unittest
+from unittest import mock
+
+import tiktoken
+
+from pipelines.config import LLMConfig
+
+from tests.utils import make_pipeline
+
+
+def byte_encoding() -> tiktoken.Encoding:
+    """A tiktoken encoding with one token per byte, so it needs no download."""
+    return tiktoken.Encoding(
+        name="bytes",
+        pat_str=r"\S+|\s+",
+        mergeable_ranks={bytes([i]): i for i in range(256)},
+        special_tokens={},
+    )
+
+
+class TruncationTest(unittest.TestCase):
+    CONTEXT_WINDOW = 2000
+    MAX_TOKENS = 16
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+
+        self.encoding = byte_encoding()
+        patch = mock.patch(
+            "pipelines.paper_review_pipeline._load_encoding",
+            return_value=self.encoding,
+        )
+        patch.start()
+        self.addCleanup(patch.stop)
+
+        self.llm = LLMConfig(
+            api_key="test-key",
+            context_window=self.CONTEXT_WINDOW,
+            max_tokens=self.MAX_TOKENS,
+        )
+        self.pipeline = make_pipeline(self._tmp.name, llm=self.llm)
+        self.addCleanup(self.pipeline.review_cache.close)
+
+    def count(self, text: str) -> int:
+        return len(self.encoding.encode(text))
+
+    def prepare(self, content: str):
+        return self.pipeline._prepare_review_request({"content": content}, "neurips")
+
+    def test_short_content_is_kept(self):
+        content = "A short paper."
+
+        prompt, request_tokens = self.prepare(content)
+
+        self.assertEqual(prompt, self.pipeline._PROMPT_HEADER + content)
+        self.assertEqual(
+            request_tokens,
+            self.count(self.llm.system_prompt) + self.count(prompt) + self.MAX_TOKENS,
+        )
+
+    def test_long_content_is_cut_to_the_budget(self):
+        header = self.pipeline._PROMPT_HEADER
+        marker = self.pipeline._TRUNCATION_MARKER
+        budget = (
+            self.CONTEXT_WINDOW
+            - self.MAX_TOKENS
+            - self.count(self.llm.system_prompt)
+            - self.count(header)
+        )
+        content = "word " * self.CONTEXT_WINDOW
+
+        prompt, request_tokens = self.prepare(content)
+
+        self.assertTrue(prompt.startswith(header))
+        self.assertTrue(prompt.endswith(marker))
+        kept = prompt[len(header) : -len(marker)]
+        self.assertEqual(kept, content[: budget - self.count(marker)])
+        self.assertEqual(self.count(kept) + self.count(marker), budget)
+
+        # The returned count is what tiktoken gives for the full request, and
+        # fills the context window exactly
+        self.assertEqual(
+            request_tokens,
+            self.count(self.llm.system_prompt) + self.count(prompt) + self.MAX_TOKENS,
+        )
+        self.assertEqual(request_tokens, self.CONTEXT_WINDOW)
+
+
+if __name__ == "__main__":
+    unittest.main()
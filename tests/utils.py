@@ -0,0 +1,14 @@
+from pipelines import PaperReviewPipeline, PaperReviewConfig
+from pipelines.config import MinerUConfig, LLMConfig
+
+
+def make_pipeline(tmp_dir: str, **config) -> PaperReviewPipeline:
+    config.setdefault("save_review_results", False)
+    return PaperReviewPipeline(
+        PaperReviewConfig(
+            cache_dir=tmp_dir,
+            mineru=MinerUConfig(api_key="test-key", output_dir=tmp_dir),
+            llm=config.pop("llm", LLMConfig(api_key="test-key")),
+            **config,
+        )
+    )